@@ -3,11 +3,26 @@ MCP Request Dispatcher
 Routes MCP protocol requests to appropriate handlers
 """
 from typing import Dict, Any
+import json
 import logging
 
+from resource_encyclopedia.catalog import parse_limit
+from resource_encyclopedia.move_dex import MoveQuery
+from resource_encyclopedia.species_index import SpeciesQuery
+
 logger = logging.getLogger(__name__)
 
 class MCPDispatcher:
+    # Page size for catalog listings when the client does not ask for one
+    DEFAULT_LIST_LIMIT = 100
+    MAX_LIST_LIMIT = 1000
+    # Movepool pages resolve move details on read, so they stay smaller
+    DEFAULT_MOVE_PAGE = 20
+    MAX_MOVE_PAGE = 100
+    # Query results are full species or move records
+    DEFAULT_QUERY_PAGE = 20
+    MAX_QUERY_PAGE = 200
+
     def __init__(self, pokemon_resource, battle_tool):
         self.pokemon_resource = pokemon_resource
         self.battle_tool = battle_tool
@@ -56,7 +71,44 @@ class MCPDispatcher:
                 {
                     "uri": "pokemon://data",
                     "name": "Pokémon Data",
-                    "description": "Comprehensive Pokémon information including stats, types, abilities, and moves",
+                    "description": (
+                        "Comprehensive Pokémon information including stats, types, abilities, and moves. "
+                        "Pass 'pokemon' for one record (optionally with 'profile': battle, summary or full), "
+                        "or 'prefix', 'limit' and 'cursor' to page through the name catalog"
+                    ),
+                    "mimeType": "application/json"
+                },
+                {
+                    "uri": "pokemon://moves",
+                    "name": "Pokémon Movepool",
+                    "description": (
+                        "Every move a Pokémon learns, with details. "
+                        "Pass 'pokemon', plus 'limit' and 'cursor' to page through the movepool"
+                    ),
+                    "mimeType": "application/json"
+                },
+                {
+                    "uri": "pokemon://query",
+                    "name": "Pokémon Query",
+                    "description": (
+                        "Species matching several criteria, answered from local indexes. "
+                        "Pass any of 'types' (comma separated, with 'type_match': any or all), "
+                        "'generations', 'min_<field>'/'max_<field>' for id, hp, attack, defense, "
+                        "special_attack, special_defense, speed, base_stat_total, height, weight or "
+                        "base_experience, 'sort' (a field, '-' prefix for descending), 'limit' and 'cursor'"
+                    ),
+                    "mimeType": "application/json"
+                },
+                {
+                    "uri": "pokemon://movedex",
+                    "name": "Move Dex",
+                    "description": (
+                        "Every move, answered from the local move dex. Pass 'move' (name or id) for one "
+                        "move, or any of 'types', 'categories' (physical, special, status) and 'ailments' "
+                        "(comma separated, matching any), 'min_<field>'/'max_<field>' for id, power, "
+                        "accuracy, pp, priority or effect_chance, 'sort' (a field, '-' prefix for "
+                        "descending), 'limit' and 'cursor'"
+                    ),
                     "mimeType": "application/json"
                 }
             ]
@@ -70,29 +122,103 @@ class MCPDispatcher:
             # Get query parameters
             pokemon_name = params.get("pokemon", "")
             if pokemon_name:
-                data = await self.pokemon_resource.get_pokemon_data(pokemon_name.lower())
+                data = await self.pokemon_resource.get_pokemon_data(
+                    pokemon_name.lower(), profile=params.get("profile", "full")
+                )
                 return {
                     "contents": [
                         {
                             "uri": uri,
                             "mimeType": "application/json",
-                            "text": str(data)
+                            "text": json.dumps(data)
                         }
                     ]
                 }
             else:
-                # Return list of all available Pokémon
-                data = await self.pokemon_resource.list_all_pokemon()
+                # Return one page of the Pokémon catalog
+                data = await self.pokemon_resource.list_all_pokemon(
+                    prefix=params.get("prefix", ""),
+                    cursor=params.get("cursor"),
+                    limit=parse_limit(params.get("limit"), self.DEFAULT_LIST_LIMIT, self.MAX_LIST_LIMIT)
+                )
                 return {
                     "contents": [
                         {
                             "uri": uri,
                             "mimeType": "application/json",
-                            "text": str(data)
+                            "text": json.dumps(data)
                         }
-                    ]
+                    ],
+                    "nextCursor": data["next_cursor"]
                 }
         
+        if uri == "pokemon://moves":
+            pokemon_name = params.get("pokemon", "")
+            if not pokemon_name:
+                raise ValueError("pokemon must be specified")
+            data = await self.pokemon_resource.get_move_page(
+                pokemon_name,
+                cursor=params.get("cursor"),
+                limit=parse_limit(params.get("limit"), self.DEFAULT_MOVE_PAGE, self.MAX_MOVE_PAGE)
+            )
+            return {
+                "contents": [
+                    {
+                        "uri": uri,
+                        "mimeType": "application/json",
+                        "text": json.dumps(data)
+                    }
+                ],
+                "nextCursor": data["next_cursor"]
+            }
+
+        if uri == "pokemon://query":
+            query = SpeciesQuery.from_params(
+                {key: value for key, value in params.items() if key != "uri"},
+                default_limit=self.DEFAULT_QUERY_PAGE,
+                max_limit=self.MAX_QUERY_PAGE
+            )
+            data = await self.pokemon_resource.query_pokemon(query)
+            return {
+                "contents": [
+                    {
+                        "uri": uri,
+                        "mimeType": "application/json",
+                        "text": json.dumps(data)
+                    }
+                ],
+                "nextCursor": data["next_cursor"]
+            }
+
+        if uri == "pokemon://movedex":
+            if params.get("move"):
+                data = await self.pokemon_resource.find_move(str(params["move"]))
+                return {
+                    "contents": [
+                        {
+                            "uri": uri,
+                            "mimeType": "application/json",
+                            "text": json.dumps(data)
+                        }
+                    ]
+                }
+            query = MoveQuery.from_params(
+                {key: value for key, value in params.items() if key != "uri"},
+                default_limit=self.DEFAULT_QUERY_PAGE,
+                max_limit=self.MAX_QUERY_PAGE
+            )
+            data = await self.pokemon_resource.query_moves(query)
+            return {
+                "contents": [
+                    {
+                        "uri": uri,
+                        "mimeType": "application/json",
+                        "text": json.dumps(data)
+                    }
+                ],
+                "nextCursor": data["next_cursor"]
+            }
+
         raise ValueError(f"Unknown resource URI: {uri}")
     
     async def _handle_list_tools(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -3,24 +3,70 @@ Pokémon Battle Simulation MCP Server
 Main FastAPI server entry point
 """
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import logging
 
 from dispatcher import MCPDispatcher
 from resource_encyclopedia.poke_data import PokemonDataResource
+from resource_encyclopedia.service import DataService
+from resource_encyclopedia.move_dex import MoveQuery
+from resource_encyclopedia.species_index import SpeciesQuery
+from resource_encyclopedia.snapshots import SnapshotWatcher
+from resource_encyclopedia.warmup import CacheWarmer
 from tools.battle_simulate import BattleSimulationTool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Initialize MCP components: one data service (pool + caches) per process,
+# injected into every consumer
+data_service = DataService.from_env()
+battle_tool = BattleSimulationTool(data_service.resource)
+dispatcher = MCPDispatcher(data_service.resource, battle_tool)
+warmer: Optional[CacheWarmer] = None
+# Offline mode only: swaps new dataset versions in without a restart
+snapshot_watcher: Optional[SnapshotWatcher] = (
+    SnapshotWatcher.from_env(data_service.resource) if data_service.resource.offline else None
+)
+
+def get_pokemon_data() -> PokemonDataResource:
+    return data_service.resource
+
+def get_battle_tool() -> BattleSimulationTool:
+    return battle_tool
+
+def get_dispatcher() -> MCPDispatcher:
+    return dispatcher
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared upstream connections and caches on startup, close them on shutdown"""
+    global warmer
+    await data_service.start()
+    # Prefetch hot Pokémon in the background; /ready reports progress
+    warmer = CacheWarmer.from_env(data_service.resource, data_service.access_log)
+    warmer.start()
+    if snapshot_watcher is not None:
+        snapshot_watcher.start()
+    try:
+        yield
+    finally:
+        if snapshot_watcher is not None:
+            await snapshot_watcher.stop()
+        await warmer.stop()
+        await data_service.close()
+
 app = FastAPI(
     title="Pokémon Battle Simulation MCP Server",
     description="MCP Server providing Pokémon data resources and battle simulation tools",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -32,11 +78,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize MCP components
-pokemon_data = PokemonDataResource()
-battle_tool = BattleSimulationTool()
-dispatcher = MCPDispatcher(pokemon_data, battle_tool)
-
 # MCP Protocol Models
 class MCPRequest(BaseModel):
     jsonrpc: str = "2.0"
@@ -64,7 +105,7 @@ async def root():
     }
 
 @app.post("/mcp")
-async def mcp_endpoint(request: MCPRequest):
+async def mcp_endpoint(request: MCPRequest, dispatcher: MCPDispatcher = Depends(get_dispatcher)):
     """Main MCP protocol endpoint"""
     try:
         logger.info(f"Received MCP request: {request.method}")
@@ -90,23 +131,81 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "server": "pokemon-mcp"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until warm-up reaches its target fraction, finishes or times out"""
+    status = warmer.status() if warmer is not None else {"ready": False}
+    if not status["ready"]:
+        return JSONResponse(status_code=503, content=status)
+    return status
+
+@app.get("/cache/stats")
+async def cache_stats(pokemon_data: PokemonDataResource = Depends(get_pokemon_data)):
+    """Cache hit, miss and eviction counters"""
+    return pokemon_data.cache_stats()
+
+@app.get("/dataset")
+async def dataset_status():
+    """Live dataset snapshot version and swap history (offline mode)"""
+    if snapshot_watcher is None:
+        raise HTTPException(status_code=404, detail="Not serving a local dataset")
+    return snapshot_watcher.status()
+
+@app.post("/dataset/reload")
+async def reload_dataset():
+    """Swap in the dataset now on disk if its version changed, without waiting for the next poll"""
+    if snapshot_watcher is None:
+        raise HTTPException(status_code=404, detail="Not serving a local dataset")
+    swapped = await snapshot_watcher.check()
+    return {"swapped": swapped, **snapshot_watcher.status()}
+
 @app.get("/capabilities")
-async def get_capabilities():
+async def get_capabilities(dispatcher: MCPDispatcher = Depends(get_dispatcher)):
     """Get server capabilities"""
     return await dispatcher.handle_request("initialize", {})
 
 # Development endpoints for testing
 @app.get("/pokemon/{pokemon_name}")
-async def get_pokemon_direct(pokemon_name: str):
+async def get_pokemon_direct(pokemon_name: str, profile: str = "full",
+                             pokemon_data: PokemonDataResource = Depends(get_pokemon_data)):
     """Direct endpoint to get Pokémon data (for testing)"""
+    if profile not in PokemonDataResource.PROFILES:
+        # A bad parameter is the client's error, not a missing Pokémon
+        raise HTTPException(status_code=400, detail=f"Unknown load profile: {profile} "
+                                                    f"(expected one of {', '.join(PokemonDataResource.PROFILES)})")
     try:
-        result = await pokemon_data.get_pokemon_data(pokemon_name.lower())
+        result = await pokemon_data.get_pokemon_data(pokemon_name.lower(), profile=profile)
         return result
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+@app.get("/query/pokemon")
+async def query_pokemon(request: Request, pokemon_data: PokemonDataResource = Depends(get_pokemon_data),
+                        dispatcher: MCPDispatcher = Depends(get_dispatcher)):
+    """Species filtered by type, generation and stat ranges, e.g. ?types=fire,dragon&min_speed=100&sort=-special_attack"""
+    try:
+        # Same page sizes as the MCP query resources
+        query = SpeciesQuery.from_params(dict(request.query_params), default_limit=dispatcher.DEFAULT_QUERY_PAGE,
+                                         max_limit=dispatcher.MAX_QUERY_PAGE)
+        return await pokemon_data.query_pokemon(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/query/moves")
+async def query_moves(request: Request, pokemon_data: PokemonDataResource = Depends(get_pokemon_data),
+                      dispatcher: MCPDispatcher = Depends(get_dispatcher)):
+    """Moves filtered by type, category, ailment and numeric ranges, e.g. ?types=fire&categories=special&min_power=90"""
+    try:
+        # Same page sizes as the MCP query resources
+        query = MoveQuery.from_params(dict(request.query_params), default_limit=dispatcher.DEFAULT_QUERY_PAGE,
+                                      max_limit=dispatcher.MAX_QUERY_PAGE)
+        return await pokemon_data.query_moves(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.post("/battle")
-async def simulate_battle_direct(pokemon1: str, pokemon2: str):
+async def simulate_battle_direct(pokemon1: str, pokemon2: str,
+                                 battle_tool: BattleSimulationTool = Depends(get_battle_tool)):
     """Direct endpoint to simulate battle (for testing)"""
     try:
         result = await battle_tool.simulate_battle(pokemon1.lower(), pokemon2.lower())
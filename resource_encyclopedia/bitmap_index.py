@@ -0,0 +1,175 @@
+"""
+Bitmap Index
+Row bitmaps, sorted columns and query parameter parsing shared by the
+species and move indexes
+
+A bitmap is a Python int with one bit per row, so OR/AND of filters are
+single int operations. A sorted column keeps rows ordered by value: a range
+is two bisects, and ordering a result is a scan that stops once the page is full.
+
+Both can be patched for a few changed rows into a copy, so an index built on
+one dataset version is updated for the next without touching the original.
+"""
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from resource_encyclopedia.catalog import decode_cursor, encode_cursor, parse_limit
+
+# field, min, max; either end None for open
+Range = Tuple[str, Optional[int], Optional[int]]
+
+
+def bitmap(rows: Iterable[int], size: int) -> int:
+    bits = bytearray((size + 7) // 8)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
+
+
+def group_bitmaps(keys: Sequence[Any], size: int) -> Dict[Any, int]:
+    """One bitmap per distinct key, given each row's key (None = no key)"""
+    rows: Dict[Any, List[int]] = {}
+    for row, key in enumerate(keys):
+        if key is not None:
+            rows.setdefault(key, []).append(row)
+    return {key: bitmap(members, size) for key, members in rows.items()}
+
+
+def patch_bitmaps(bitmaps: Dict[Any, int],
+                  changes: Iterable[Tuple[int, Iterable[Any], Iterable[Any]]]) -> Dict[Any, int]:
+    """A copy of group bitmaps with each (row, old keys, new keys) moved"""
+    patched = dict(bitmaps)
+    for row, old_keys, new_keys in changes:
+        bit = 1 << row
+        for key in old_keys:
+            if key is not None:
+                patched[key] &= ~bit
+                if not patched[key]:
+                    del patched[key]
+        for key in new_keys:
+            if key is not None:
+                patched[key] = patched.get(key, 0) | bit
+    return patched
+
+
+class SortedColumn:
+    """Rows ordered by one column's value; rows without a value are kept apart"""
+
+    def __init__(self, values: Sequence[Optional[int]]):
+        present = sorted((row for row, value in enumerate(values) if value is not None), key=values.__getitem__)
+        self.size = len(values)
+        self.rows = array("I", present)
+        self.values = array("l", (values[row] for row in present))
+        self.missing = [row for row, value in enumerate(values) if value is None]
+
+    def range(self, lo: Optional[int], hi: Optional[int]) -> int:
+        """Bitmap of the rows with lo <= value <= hi"""
+        start = 0 if lo is None else bisect_left(self.values, lo)
+        end = len(self.values) if hi is None else bisect_right(self.values, hi)
+        return bitmap(self.rows[start:end], self.size)
+
+    def order(self, descending: bool = False) -> Iterable[int]:
+        # Rows without a value come last either way
+        return chain(reversed(self.rows) if descending else self.rows, self.missing)
+
+    def patched(self, changes: Iterable[Tuple[int, Optional[int], Optional[int]]]) -> "SortedColumn":
+        """A copy with each (row, old value, new value) moved to where a full sort would put it"""
+        column = SortedColumn.__new__(SortedColumn)
+        column.size = self.size
+        column.rows = array("I", self.rows)
+        column.values = array("l", self.values)
+        column.missing = list(self.missing)
+        for row, old, new in changes:
+            if old == new:
+                continue
+            if old is None:
+                column.missing.remove(row)
+            else:
+                position = column._position(row, old)
+                del column.rows[position]
+                del column.values[position]
+            if new is None:
+                insort(column.missing, row)
+            else:
+                position = column._position(row, new)
+                column.rows.insert(position, row)
+                column.values.insert(position, new)
+        return column
+
+    def _position(self, row: int, value: int) -> int:
+        # Equal values stay in row order, as the stable sort leaves them
+        position = bisect_left(self.values, value)
+        while position < len(self.values) and self.values[position] == value and self.rows[position] < row:
+            position += 1
+        return position
+
+
+def select(bits: int, size: int, order: Iterable[int], offset: int, limit: int) -> Tuple[int, List[int]]:
+    """(number of matching rows, the matching rows offset..offset+limit in order)"""
+    total = bin(bits).count("1")
+    mask = bits.to_bytes((size + 7) // 8 or 1, "little")
+    end = offset + limit
+    page: List[int] = []
+    seen = 0
+    for row in order:
+        if mask[row >> 3] >> (row & 7) & 1:
+            if seen >= offset:
+                page.append(row)
+            seen += 1
+            if seen >= end:
+                break
+    return total, page
+
+
+def next_cursor(offset: int, limit: int, total: int) -> Optional[str]:
+    end = offset + limit
+    return encode_cursor(str(end)) if end < total else None
+
+
+def split_list(value: Any) -> List[str]:
+    """A list parameter given as a list or a comma separated string"""
+    if value is None:
+        return []
+    items = value if isinstance(value, (list, tuple)) else str(value).split(",")
+    return [str(item).strip().lower() for item in items if str(item).strip()]
+
+
+def parse_ranges(params: Dict[str, Any], fields: Sequence[str]) -> Tuple[Range, ...]:
+    """min_<field> / max_<field> parameters"""
+    ranges: Dict[str, List[Optional[int]]] = {}
+    for key, value in params.items():
+        bound, _, field = key.partition("_")
+        if bound not in ("min", "max") or not field:
+            continue
+        if field not in fields:
+            raise ValueError(f"Unknown query field: {field} (expected one of {', '.join(fields)})")
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{key} must be an integer")
+        ranges.setdefault(field, [None, None])[0 if bound == "min" else 1] = number
+    return tuple((field, lo, hi) for field, (lo, hi) in sorted(ranges.items()))
+
+
+def parse_sort(params: Dict[str, Any], fields: Sequence[str], default: str = "id") -> Tuple[str, bool]:
+    """(field, descending) from a sort parameter such as '-power'"""
+    sort = str(params.get("sort") or default).strip().lower()
+    descending = sort.startswith("-")
+    sort = sort.lstrip("-")
+    if sort not in fields:
+        raise ValueError(f"Unknown sort field: {sort} (expected one of {', '.join(fields)})")
+    return sort, descending
+
+
+def parse_page(params: Dict[str, Any], default_limit: int, max_limit: int) -> Tuple[int, int]:
+    """(offset, limit) from limit and cursor parameters"""
+    limit = parse_limit(params.get("limit"), default_limit, max_limit)
+    offset = 0
+    if params.get("cursor"):
+        decoded = decode_cursor(params["cursor"])
+        if not decoded.isdigit():
+            raise ValueError(f"Invalid cursor: {params['cursor']}")
+        offset = int(decoded)
+    return offset, limit
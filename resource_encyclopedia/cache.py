@@ -0,0 +1,432 @@
+"""
+Bounded Cache
+Size-aware in-memory cache with TTLs, pluggable eviction policies and an
+optional zlib-compressed tier for cold entries
+"""
+import json
+import os
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the footprint of a JSON-like value in bytes"""
+    try:
+        return len(json.dumps(value, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 1
+
+
+class _Cold:
+    """A demoted value: compressed JSON plus its uncompressed length"""
+
+    __slots__ = ("blob", "raw_size")
+
+    def __init__(self, blob: bytes, raw_size: int):
+        self.blob = blob
+        self.raw_size = raw_size
+
+    def load(self) -> Any:
+        return json.loads(zlib.decompress(self.blob))
+
+
+class CountMinSketch:
+    """4-bit style frequency sketch with periodic aging (TinyLFU)"""
+
+    def __init__(self, width: int = 1024, depth: int = 4):
+        self.width = max(16, width)
+        self.depth = depth
+        self.table = [[0] * self.width for _ in range(depth)]
+        self.additions = 0
+        self.sample_size = self.width * 10
+
+    def _indexes(self, key: Hashable) -> List[int]:
+        h = hash(key)
+        return [((h >> (i * 8)) ^ (h * (i + 1) * 0x9E3779B1)) % self.width for i in range(self.depth)]
+
+    def increment(self, key: Hashable) -> None:
+        for row, index in zip(self.table, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        return min(row[index] for row, index in zip(self.table, self._indexes(key)))
+
+    def _age(self) -> None:
+        """Halve every counter so old popularity fades"""
+        for row in self.table:
+            for i in range(self.width):
+                row[i] >>= 1
+        self.additions //= 2
+
+
+class EvictionPolicy(ABC):
+    """Decides which keys stay resident; the cache owns the values"""
+
+    @abstractmethod
+    def on_hit(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def on_insert(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def on_remove(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def victim(self) -> Optional[Hashable]:
+        ...
+
+    def select_eviction(self) -> Optional[Hashable]:
+        """Pick the key to drop when the cache is over budget"""
+        return self.victim()
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key"""
+
+    def __init__(self):
+        self.order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def on_hit(self, key: Hashable) -> None:
+        self.order.move_to_end(key)
+
+    def on_insert(self, key: Hashable) -> None:
+        self.order[key] = None
+
+    def on_remove(self, key: Hashable) -> None:
+        self.order.pop(key, None)
+
+    def victim(self) -> Optional[Hashable]:
+        return next(iter(self.order), None)
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """W-TinyLFU: a small LRU window in front of a segmented LRU main area.
+
+    Keys enter the window; once it overflows, the window's oldest key joins
+    probation and must out-score the probation victim in the frequency
+    sketch to stay, so one-hit wonders cannot flush popular species.
+    """
+
+    def __init__(self, capacity_hint: int = 1000, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        self.sketch = CountMinSketch(width=max(64, capacity_hint * 4))
+        self.window: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.probation: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.protected: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.window_size = max(1, int(capacity_hint * window_ratio))
+        self.protected_size = max(1, int(capacity_hint * protected_ratio))
+
+    def on_hit(self, key: Hashable) -> None:
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.probation:
+            del self.probation[key]
+            self.protected[key] = None
+            if len(self.protected) > self.protected_size:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+
+    def on_insert(self, key: Hashable) -> None:
+        self.sketch.increment(key)
+        self.window[key] = None
+        if len(self.window) > self.window_size:
+            # Window overflow: its oldest key becomes a main-area candidate
+            candidate, _ = self.window.popitem(last=False)
+            self.probation[candidate] = None
+
+    def on_remove(self, key: Hashable) -> None:
+        self.window.pop(key, None)
+        self.probation.pop(key, None)
+        self.protected.pop(key, None)
+
+    def victim(self) -> Optional[Hashable]:
+        for segment in (self.probation, self.protected, self.window):
+            if segment:
+                return next(iter(segment))
+        return None
+
+    def admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        return self.sketch.estimate(candidate) > self.sketch.estimate(victim)
+
+    def select_eviction(self) -> Optional[Hashable]:
+        """Pick the key to drop, comparing the newest probation entry against the victim"""
+        if len(self.probation) >= 2:
+            victim = next(iter(self.probation))
+            candidate = next(reversed(self.probation))
+            if self.admit(candidate, victim):
+                return victim
+            return candidate
+        return self.victim()
+
+
+POLICIES = {
+    "lru": LRUPolicy,
+    "tinylfu": TinyLFUPolicy,
+}
+
+
+class BoundedCache:
+    """Entry- and byte-bounded cache with per-entry TTL.
+
+    A zero limit disables that bound; a ttl of None keeps entries until
+    they are evicted. With a stale_ttl, expired entries are kept that much
+    longer so get_or_stale() can serve them while a refresh runs.
+
+    With hot_entries set, only that many recently used values stay live;
+    colder ones are kept as zlib-compressed JSON and promoted back on access.
+    Values must then be JSON round-trippable (no tuples or non-str keys).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 0,
+        ttl: Optional[float] = None,
+        policy: str = "lru",
+        stale_ttl: float = 0,
+        hot_entries: int = 0,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.policy_name = policy
+        self.policy = TinyLFUPolicy(max_entries or 1000) if policy == "tinylfu" else POLICIES[policy]()
+        self.sizeof = sizeof
+        self.clock = clock
+        # key -> (value, size, expires_at)
+        self._entries: Dict[Hashable, tuple] = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+        # Compressed tier: keys of live values, least recently used first
+        self.hot_entries = hot_entries
+        self._hot: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.cold_count = 0
+        self.cold_bytes = 0
+        self.cold_raw_bytes = 0
+        self.demotions = 0
+        self.promotions = 0
+
+    @classmethod
+    def from_env(cls, prefix: str, max_entries: int = 1000, ttl: Optional[float] = None,
+                 policy: str = "lru", stale_ttl: float = 0, hot_entries: int = 0) -> "BoundedCache":
+        """Build a cache from <PREFIX>_MAX_ENTRIES/_MAX_BYTES/_TTL/_STALE_TTL/_POLICY/_HOT_ENTRIES variables"""
+        raw_ttl = os.environ.get(f"{prefix}_TTL")
+        return cls(
+            max_entries=int(os.environ.get(f"{prefix}_MAX_ENTRIES", str(max_entries))),
+            max_bytes=int(os.environ.get(f"{prefix}_MAX_BYTES", "0")),
+            ttl=float(raw_ttl) if raw_ttl else ttl,
+            policy=os.environ.get(f"{prefix}_POLICY", policy).lower(),
+            stale_ttl=float(os.environ.get(f"{prefix}_STALE_TTL", str(stale_ttl))),
+            hot_entries=int(os.environ.get(f"{prefix}_HOT_ENTRIES", str(hot_entries))),
+        )
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def _expired(self, entry: tuple) -> bool:
+        return entry[2] is not None and entry[2] <= self.clock()
+
+    def _dead(self, entry: tuple) -> bool:
+        """Expired and past the stale grace period"""
+        return entry[2] is not None and entry[2] + self.stale_ttl <= self.clock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live value, counting the hit or miss"""
+        return self.get_or_stale(key, default, allow_stale=False)[0]
+
+    def get_or_stale(self, key: Hashable, default: Any = None, allow_stale: bool = True) -> Tuple[Any, bool]:
+        """Return (value, stale); expired entries within stale_ttl come back flagged stale"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default, False
+        if self._dead(entry):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default, False
+        if self._expired(entry):
+            if not allow_stale:
+                self.misses += 1
+                return default, False
+            self.stale_hits += 1
+            self.policy.on_hit(key)
+            return self._live(key, entry), True
+        self.hits += 1
+        self.policy.on_hit(key)
+        return self._live(key, entry), False
+
+    def _live(self, key: Hashable, entry: tuple) -> Any:
+        """The entry's value as a live object, promoting it if it was compressed"""
+        value = entry[0]
+        if not isinstance(value, _Cold):
+            self._touch(key)
+            return value
+        self._forget_cold(value)
+        self.promotions += 1
+        value = value.load()
+        size = self.sizeof(value) if self.max_bytes else 0
+        self._entries[key] = (value, size, entry[2])
+        self.current_bytes += size - entry[1]
+        self._touch(key)
+        self._enforce_budget()
+        return value
+
+    def _touch(self, key: Hashable) -> None:
+        """Mark a live value as most recently used, demoting the coldest past hot_entries"""
+        if not self.hot_entries:
+            return
+        self._hot[key] = None
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_entries:
+            cold_key, _ = self._hot.popitem(last=False)
+            self._demote(cold_key)
+
+    def _demote(self, key: Hashable) -> None:
+        value, size, expires_at = self._entries[key]
+        try:
+            raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError):
+            # Not serializable: it simply stays live
+            return
+        cold = _Cold(zlib.compress(raw), len(raw))
+        cold_size = len(cold.blob) if self.max_bytes else 0
+        self._entries[key] = (cold, cold_size, expires_at)
+        self.current_bytes += cold_size - size
+        self.cold_count += 1
+        self.cold_bytes += len(cold.blob)
+        self.cold_raw_bytes += cold.raw_size
+        self.demotions += 1
+
+    def _forget_cold(self, value: Any) -> None:
+        if isinstance(value, _Cold):
+            self.cold_count -= 1
+            self.cold_bytes -= len(value.blob)
+            self.cold_raw_bytes -= value.raw_size
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Insert or replace a value, evicting until the budgets hold"""
+        size = self.sizeof(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+        previous = self._entries.get(key)
+        self._entries[key] = (value, size, expires_at)
+        if previous is not None:
+            # Replacing keeps the key's recency/frequency standing
+            self._forget_cold(previous[0])
+            self.current_bytes += size - previous[1]
+            self.policy.on_hit(key)
+        else:
+            self.current_bytes += size
+            self.policy.on_insert(key)
+        self._touch(key)
+        self._enforce_budget()
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """A value, expired or not, without counting a hit or promoting it"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        return entry[0].load() if isinstance(entry[0], _Cold) else entry[0]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._remove(key)
+        return entry[0].load() if isinstance(entry[0], _Cold) else entry[0]
+
+    def clear(self) -> None:
+        for key in list(self._entries):
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        value, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+        self._forget_cold(value)
+        self._hot.pop(key, None)
+        self.policy.on_remove(key)
+
+    def _over_budget(self) -> bool:
+        if self.max_entries and len(self._entries) > self.max_entries:
+            return True
+        return bool(self.max_bytes) and self.current_bytes > self.max_bytes
+
+    def _enforce_budget(self) -> None:
+        while self._over_budget():
+            victim = self.policy.select_eviction()
+            if victim is None:
+                break
+            self._remove(victim)
+            self.evictions += 1
+
+    def purge_expired(self) -> int:
+        """Drop every entry past its stale grace period; returns how many were removed"""
+        expired = [key for key, entry in self._entries.items() if self._dead(entry)]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "policy": self.policy_name,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "hot_entries": self.hot_entries,
+            "cold": {
+                "entries": self.cold_count,
+                "bytes": self.cold_bytes,
+                "raw_bytes": self.cold_raw_bytes,
+                "compression_ratio": round(self.cold_raw_bytes / self.cold_bytes, 2) if self.cold_bytes else None,
+                "demotions": self.demotions,
+                "promotions": self.promotions,
+            },
+        }
@@ -0,0 +1,93 @@
+"""
+Pokémon Catalog
+Locally held index of every valid Pokémon name and id
+"""
+import base64
+import re
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# PokéAPI identifiers are lowercase ASCII words joined by hyphens
+VALID_NAME = re.compile(r"^[a-z0-9][a-z0-9-]{0,63}$")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, trim and hyphenate a user-supplied Pokémon name"""
+    return "-".join(name.strip().lower().split())
+
+
+def encode_cursor(value: str) -> str:
+    return base64.urlsafe_b64encode(value.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def parse_limit(value: Any, default: int, maximum: int) -> int:
+    """A page size parameter as an integer clamped to 1..maximum"""
+    if value is None or value == "":
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"limit must be an integer, got {value!r}")
+    return max(1, min(limit, maximum))
+
+
+def _id_from_url(url: str) -> int:
+    return int(url.rstrip("/").rsplit("/", 1)[1])
+
+
+class PokemonCatalog:
+    """Sorted name list plus id set, built once and checked before any request"""
+
+    def __init__(self, entries: Iterable[Tuple[str, int]]):
+        pairs = sorted(entries)
+        self.names = [name for name, _ in pairs]
+        self.ids = frozenset(pokemon_id for _, pokemon_id in pairs)
+        self._name_set = frozenset(self.names)
+
+    @classmethod
+    def from_listing(cls, listing: Dict[str, Any]) -> "PokemonCatalog":
+        """Build from a /pokemon?limit=N response"""
+        return cls((item["name"], _id_from_url(item["url"])) for item in listing["results"])
+
+    @classmethod
+    def from_species_table(cls, table) -> "PokemonCatalog":
+        ids = table.columns["id"]
+        return cls((table.name(row), ids[row]) for row in range(len(table)))
+
+    def __contains__(self, ident: str) -> bool:
+        if ident.isdigit():
+            return int(ident) in self.ids
+        return ident in self._name_set
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """[start, end) slice of the sorted names that start with prefix"""
+        if not prefix:
+            return 0, len(self.names)
+        start = bisect_left(self.names, prefix)
+        end = bisect_left(self.names, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+        return start, end
+
+    def search(self, prefix: str = "", cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """One page of names matching prefix, continuing after an opaque cursor"""
+        prefix = normalize_name(prefix)
+        start, end = self.prefix_range(prefix)
+        total = end - start
+        if cursor:
+            start = max(start, bisect_right(self.names, decode_cursor(cursor), start, end))
+        page = self.names[start:min(end, start + max(0, limit))]
+        has_more = start + len(page) < end
+        return {
+            "count": total,
+            "pokemon": page,
+            "next_cursor": encode_cursor(page[-1]) if page and has_more else None,
+        }
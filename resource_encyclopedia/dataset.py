@@ -0,0 +1,410 @@
+"""
+Local Dataset
+Offline PokéAPI dataset: builder CLI and in-process reader
+
+Build from an api-data JSON dump:
+    python -m resource_encyclopedia.dataset build --api-data path/to/api-data/data --out dataset
+Build from a one-time crawl of PokéAPI:
+    python -m resource_encyclopedia.dataset build --crawl --out dataset
+
+Besides the per-kind JSON files, the builder writes species.bin, the
+memory-mapped columnar table read by resource_encyclopedia.species_table.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from resource_encyclopedia.errors import NotFoundError
+from resource_encyclopedia.selective_json import Projection
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("pokemon", "pokemon-species", "evolution-chain", "move", "ability", "type")
+MANIFEST = "manifest.json"
+SPECIES_TABLE = "species.bin"
+FORMAT_VERSION = 1
+
+
+def relative_url(url: Optional[str]) -> Optional[str]:
+    """Strip scheme and host so dataset URLs are source independent"""
+    if not url:
+        return url
+    return urlsplit(url).path
+
+
+def _named(ref: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not ref:
+        return None
+    return {"name": ref.get("name"), "url": relative_url(ref.get("url"))}
+
+
+def _english(entries: List[Dict[str, Any]], field: str) -> List[Dict[str, Any]]:
+    return [
+        {field: entry[field], "language": {"name": "en"}}
+        for entry in entries or []
+        if entry.get("language", {}).get("name") == "en"
+    ][:1]
+
+
+def _trim_pokemon(data: Dict[str, Any]) -> Dict[str, Any]:
+    sprites = data.get("sprites") or {}
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "height": data.get("height"),
+        "weight": data.get("weight"),
+        "base_experience": data.get("base_experience"),
+        "is_default": data.get("is_default", True),
+        "stats": [{"stat": {"name": s["stat"]["name"]}, "base_stat": s["base_stat"]} for s in data["stats"]],
+        "types": [{"slot": t["slot"], "type": _named(t["type"])} for t in data["types"]],
+        "abilities": [
+            {"ability": _named(a["ability"]), "is_hidden": a["is_hidden"], "slot": a["slot"]}
+            for a in data["abilities"]
+        ],
+        "moves": [{"move": _named(m["move"])} for m in data["moves"]],
+        "species": _named(data["species"]),
+        "sprites": {key: sprites.get(key) for key in ("front_default", "back_default", "front_shiny")},
+    }
+
+
+def _trim_species(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "generation": _named(data.get("generation")),
+        "evolution_chain": {"url": relative_url(data["evolution_chain"]["url"])} if data.get("evolution_chain") else None,
+        "varieties": [
+            {"is_default": v["is_default"], "pokemon": _named(v["pokemon"])} for v in data.get("varieties", [])
+        ],
+    }
+
+
+def _trim_evolution_detail(detail: Dict[str, Any]) -> Dict[str, Any]:
+    trimmed = {
+        "min_level": detail.get("min_level"),
+        "min_happiness": detail.get("min_happiness"),
+        "time_of_day": detail.get("time_of_day"),
+    }
+    # Leave missing refs out rather than storing None; readers use .get(key, {})
+    for key in ("trigger", "item"):
+        if detail.get(key):
+            trimmed[key] = _named(detail[key])
+    return trimmed
+
+
+def _trim_chain_link(link: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "species": _named(link["species"]),
+        "evolution_details": [_trim_evolution_detail(d) for d in link.get("evolution_details", [])],
+        "evolves_to": [_trim_chain_link(child) for child in link.get("evolves_to", [])],
+    }
+
+
+def _trim_evolution_chain(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"id": data["id"], "chain": _trim_chain_link(data["chain"])}
+
+
+def _trim_move(data: Dict[str, Any]) -> Dict[str, Any]:
+    meta = data.get("meta") or {}
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "type": _named(data.get("type")),
+        "damage_class": _named(data.get("damage_class")),
+        "power": data.get("power"),
+        "accuracy": data.get("accuracy"),
+        "pp": data.get("pp"),
+        "priority": data.get("priority", 0),
+        "effect_chance": data.get("effect_chance"),
+        "effect_entries": _english(data.get("effect_entries"), "effect"),
+        "meta": {"ailment": _named(meta.get("ailment"))} if meta else None,
+        "generation": _named(data.get("generation")),
+    }
+
+
+def _trim_ability(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "effect_entries": _english(data.get("effect_entries"), "effect"),
+        "generation": _named(data.get("generation")),
+    }
+
+
+def _trim_type(data: Dict[str, Any]) -> Dict[str, Any]:
+    relations = data.get("damage_relations") or {}
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "damage_relations": {
+            key: [_named(ref) for ref in refs] for key, refs in relations.items()
+        },
+    }
+
+
+TRIMMERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "pokemon": _trim_pokemon,
+    "pokemon-species": _trim_species,
+    "evolution-chain": _trim_evolution_chain,
+    "move": _trim_move,
+    "ability": _trim_ability,
+    "type": _trim_type,
+}
+
+# Fields each trimmer (and the resource's processors) read, so large upstream
+# bodies can be parsed without building what is thrown away straight after
+FIELDS: Dict[str, Projection] = {
+    "pokemon": Projection([
+        "id", "name", "height", "weight", "base_experience", "is_default",
+        "stats.stat.name", "stats.base_stat", "types.slot", "types.type",
+        "abilities.ability", "abilities.is_hidden", "abilities.slot",
+        "moves.move", "species", "sprites.front_default", "sprites.back_default", "sprites.front_shiny",
+    ]),
+    "pokemon-species": Projection([
+        "id", "name", "generation", "evolution_chain", "varieties.is_default", "varieties.pokemon",
+    ]),
+    "move": Projection([
+        "id", "name", "type", "damage_class", "power", "accuracy", "pp", "priority",
+        "effect_chance", "effect_entries", "meta.ailment", "generation",
+    ]),
+}
+
+
+def trim_payload(kind: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an upstream payload to the fields the encyclopedia uses"""
+    return TRIMMERS[kind](data)
+
+
+def resource_key(url: str) -> str:
+    """Canonical 'kind/id' key for a resource URL, independent of host"""
+    kind, ident, _ = parse_resource_url(url)
+    return f"{kind}/{ident}"
+
+
+def parse_resource_url(url: str) -> Tuple[str, Optional[str], Dict[str, List[str]]]:
+    """Split a PokéAPI URL into (kind, identifier, query)"""
+    parts = urlsplit(url)
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if "v2" in segments:
+        segments = segments[segments.index("v2") + 1:]
+    if not segments:
+        raise NotFoundError(url)
+    ident = segments[1].lower() if len(segments) > 1 else None
+    return segments[0], ident, parse_qs(parts.query)
+
+
+class DatasetTable:
+    """All entries of one resource kind, addressable by id or name"""
+
+    def __init__(self, kind: str, entries: Dict[str, Dict[str, Any]]):
+        self.kind = kind
+        self.entries = entries
+        self.names = {entry["name"]: key for key, entry in entries.items() if "name" in entry}
+
+    def get(self, ident: str) -> Optional[Dict[str, Any]]:
+        key = ident if ident.isdigit() else self.names.get(ident)
+        return self.entries.get(key) if key is not None else None
+
+    def listing(self) -> List[Dict[str, str]]:
+        ordered = sorted(self.entries.values(), key=lambda entry: entry["id"])
+        return [{"name": entry.get("name"), "url": f"/api/v2/{self.kind}/{entry['id']}/"} for entry in ordered]
+
+
+class LocalDataset:
+    """Read-only dataset produced by the builder, served without network access"""
+
+    def __init__(self, directory: str, tables: Dict[str, DatasetTable], manifest: Dict[str, Any]):
+        self.directory = directory
+        self.tables = tables
+        self.manifest = manifest
+
+    @classmethod
+    def load(cls, directory: str) -> "LocalDataset":
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+        dataset = cls.load_tables(directory, manifest.get("kinds", KINDS))
+        dataset.manifest = manifest
+        logger.info(f"Loaded dataset {manifest.get('version')} from {directory}: "
+                    f"{ {kind: len(table.entries) for kind, table in dataset.tables.items()} }")
+        return dataset
+
+    @classmethod
+    def load_tables(cls, directory: str, kinds) -> "LocalDataset":
+        """Load the given kinds without a manifest"""
+        tables = {}
+        for kind in kinds:
+            path = os.path.join(directory, f"{kind}.json.gz")
+            if not os.path.exists(path):
+                continue
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                tables[kind] = DatasetTable(kind, json.load(f))
+        return cls(directory, tables, {})
+
+    @property
+    def version(self) -> str:
+        return self.manifest.get("version", "unknown")
+
+    def resolve(self, url: str) -> Dict[str, Any]:
+        """Answer a PokéAPI URL from local data, mirroring the upstream shape"""
+        kind, ident, query = parse_resource_url(url)
+        table = self.tables.get(kind)
+        if table is None:
+            raise NotFoundError(url)
+        if ident is None:
+            listing = table.listing()
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", ["20"])[0])
+            return {"count": len(listing), "results": listing[offset:offset + limit]}
+        entry = table.get(ident)
+        if entry is None:
+            raise NotFoundError(url)
+        return entry
+
+
+class ApiDataSource:
+    """Reads the PokeAPI/api-data JSON tree (api/v2/<kind>/<id>/index.json)"""
+
+    def __init__(self, root: str):
+        self.root = self._locate(root)
+
+    @staticmethod
+    def _locate(root: str) -> str:
+        for candidate in (root, os.path.join(root, "v2"), os.path.join(root, "api", "v2"),
+                          os.path.join(root, "data", "api", "v2")):
+            if os.path.isdir(os.path.join(candidate, "pokemon")):
+                return candidate
+        raise ValueError(f"No api/v2 tree found under {root}")
+
+    async def iter_kind(self, kind: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each payload of a kind, reading one file at a time"""
+        directory = os.path.join(self.root, kind)
+        if not os.path.isdir(directory):
+            return
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name, "index.json")
+            if name.isdigit() and os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    yield json.load(f)
+
+
+class CrawlSource:
+    """Fetches every entry of a kind from PokéAPI over one pooled client"""
+
+    def __init__(self, base_url: str = "https://pokeapi.co/api/v2", concurrency: int = 10):
+        from resource_encyclopedia.http_client import UpstreamClient
+
+        self.base_url = base_url
+        self.client = UpstreamClient.from_env()
+        self.concurrency = concurrency
+
+    async def _get(self, url: str) -> Dict[str, Any]:
+        response = await self.client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    async def iter_kind(self, kind: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each payload as it arrives, with at most `concurrency` fetches
+        in flight, so raw bodies are never held for a whole kind
+        """
+        listing = await self._get(f"{self.base_url}/{kind}?limit=100000")
+        urls = iter([item["url"] for item in listing["results"]])
+        total = len(listing["results"])
+        pending = set()
+        done_count = 0
+        try:
+            while True:
+                for url in urls:
+                    pending.add(asyncio.create_task(self._get(url)))
+                    if len(pending) >= self.concurrency:
+                        break
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+                    done_count += 1
+                    if done_count % 100 == 0 or done_count == total:
+                        logger.info(f"Crawled {kind}: {done_count}/{total}")
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def _write_json_gz(path: str, data: Any) -> None:
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+async def build_dataset(source, out_dir: str, kinds=KINDS, label: str = "") -> Dict[str, Any]:
+    """Trim every payload of every kind and write the compact dataset files"""
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {}
+    for kind in kinds:
+        # Trim each payload as it arrives; only the compact entries are kept
+        entries = {str(payload["id"]): trim_payload(kind, payload) async for payload in source.iter_kind(kind)}
+        _write_json_gz(os.path.join(out_dir, f"{kind}.json.gz"), entries)
+        counts[kind] = len(entries)
+        logger.info(f"Wrote {counts[kind]} {kind} entries")
+    if "pokemon" in kinds:
+        from resource_encyclopedia.species_table import rows_from_dataset, write_species_table
+
+        dataset = LocalDataset.load_tables(out_dir, [kind for kind in ("pokemon", "pokemon-species") if kind in kinds])
+        counts["species_table"] = write_species_table(os.path.join(out_dir, SPECIES_TABLE), rows_from_dataset(dataset))
+    manifest = {
+        "format": FORMAT_VERSION,
+        "version": time.strftime("%Y%m%d%H%M%S"),
+        "built_at": time.time(),
+        "source": label,
+        "kinds": list(kinds),
+        "counts": counts,
+    }
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build an offline PokéAPI dataset")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Build a dataset directory")
+    source_group = build.add_mutually_exclusive_group(required=True)
+    source_group.add_argument("--api-data", help="Path to a PokeAPI/api-data checkout or its data/ dir")
+    source_group.add_argument("--crawl", action="store_true", help="Crawl PokéAPI once instead")
+    build.add_argument("--out", default="dataset", help="Output directory (default: dataset)")
+    build.add_argument("--kinds", default=",".join(KINDS), help="Comma separated resource kinds")
+    build.add_argument("--concurrency", type=int, default=10, help="Parallel requests when crawling")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        parser.error(f"Unknown kinds: {', '.join(sorted(unknown))}")
+
+    async def run():
+        if args.crawl:
+            source = CrawlSource(concurrency=args.concurrency)
+            try:
+                manifest = await build_dataset(source, args.out, kinds, label="crawl")
+            finally:
+                await source.close()
+        else:
+            manifest = await build_dataset(ApiDataSource(args.api_data), args.out, kinds, label="api-data")
+        print(json.dumps(manifest["counts"], indent=2))
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
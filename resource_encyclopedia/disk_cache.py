@@ -0,0 +1,250 @@
+"""
+Disk Cache
+Persistent SQLite-backed L2 cache for PokéAPI payloads, shared by every
+worker process on the host
+"""
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace  TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    value      TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+# One row per key some worker is currently fetching from upstream
+_LEASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    namespace  TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    owner      TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class DiskCache:
+    """Write-through L2 cache stored in a local SQLite file.
+
+    Every query runs on a dedicated worker thread so the event loop never
+    blocks on disk I/O. Entries older than max_age seconds are ignored.
+    The file is opened in WAL mode so uvicorn workers on one host can share
+    it, and single_flight() lets one of them fetch a key for all the others.
+    """
+
+    # A lease outlives one upstream call with its retries, then lapses so a crashed owner cannot block a key
+    LEASE_TTL = 30.0
+    LEASE_POLL = 0.05
+
+    def __init__(self, path: str, max_age: Optional[float] = 7 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self.owner = f"{os.getpid()}-{id(self):x}"
+        self.journal_mode: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.leases_acquired = 0
+        self.lease_waits = 0
+        self.peer_fills = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["DiskCache"]:
+        """Build from POKEMON_DISK_CACHE(_MAX_AGE); an empty path disables it"""
+        path = os.environ.get("POKEMON_DISK_CACHE", "cache/pokeapi.sqlite3")
+        if not path:
+            return None
+        max_age = os.environ.get("POKEMON_DISK_CACHE_MAX_AGE")
+        return cls(path, max_age=float(max_age) if max_age else 7 * 24 * 3600)
+
+    async def _run(self, fn, *args):
+        if self._executor is None:
+            await self.open()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def open(self) -> None:
+        """Create the database file and schema if needed"""
+        if self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        await self._run(self._connect)
+        logger.info(f"Disk cache opened at {self.path}")
+
+    def _connect(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # timeout doubles as the busy wait when another worker holds the write lock
+        self._conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        self.journal_mode = self._conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if self.journal_mode != "wal":
+            logger.warning(f"Disk cache {self.path} is not in WAL mode ({self.journal_mode}); workers may contend")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_LEASE_SCHEMA)
+        self._conn.commit()
+
+    async def close(self) -> None:
+        if self._executor is None:
+            return
+        await self._run(self._disconnect)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def _disconnect(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _select(self, namespace: str, key: str) -> Optional[Tuple[str, float]]:
+        return self._conn.execute(
+            "SELECT value, fetched_at FROM entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+
+    def _upsert(self, namespace: str, key: str, value: str, fetched_at: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (namespace, key, value, fetched_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, value, fetched_at),
+        )
+        self._conn.commit()
+
+    def _acquire(self, namespace: str, key: str) -> bool:
+        now = time.time()
+        cursor = self._conn.execute(
+            "INSERT INTO leases (namespace, key, owner, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (namespace, key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE leases.expires_at < ?",
+            (namespace, key, self.owner, now + self.LEASE_TTL, now),
+        )
+        self._conn.commit()
+        return cursor.rowcount == 1
+
+    def _release(self, namespace: str, key: str) -> None:
+        self._conn.execute(
+            "DELETE FROM leases WHERE namespace = ? AND key = ? AND owner = ?", (namespace, key, self.owner)
+        )
+        self._conn.commit()
+
+    async def get_entry(self, namespace: str, key: str, allow_expired: bool = False) -> Optional[Tuple[Any, float]]:
+        """Return (value, fetched_at) for a fresh entry (or any entry with allow_expired), or None"""
+        try:
+            row = await self._run(self._select, namespace, key)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed for {namespace}/{key}: {e}")
+            row = None
+        expired = row is not None and self.max_age is not None and time.time() - row[1] > self.max_age
+        if row is None or (expired and not allow_expired):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0]), row[1]
+
+    async def get(self, namespace: str, key: str, allow_expired: bool = False) -> Optional[Any]:
+        entry = await self.get_entry(namespace, key, allow_expired)
+        return entry[0] if entry is not None else None
+
+    async def put(self, namespace: str, key: str, value: Any, fetched_at: Optional[float] = None) -> None:
+        payload = json.dumps(value, separators=(",", ":"))
+        try:
+            await self._run(self._upsert, namespace, key, payload, fetched_at or time.time())
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed for {namespace}/{key}: {e}")
+            return
+        self.writes += 1
+
+    async def single_flight(self, namespace: str, key: str, fetch: Callable[[], Awaitable[Any]],
+                            max_age: Optional[float] = None) -> Tuple[Any, bool]:
+        """Run fetch() in one process per host; returns (value, came_from_a_peer).
+
+        fetch() must put its result into this cache. The worker holding the
+        lease runs it; the others poll until the entry lands, and fetch for
+        themselves if the owner fails or the lease lapses. max_age, if given,
+        is a tighter freshness bound for a peer's entry than the cache's own.
+        """
+        deadline = time.monotonic() + self.LEASE_TTL
+        while True:
+            try:
+                acquired = await self._run(self._acquire, namespace, key)
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache lease failed for {namespace}/{key}: {e}")
+                return await fetch(), False
+            if acquired:
+                self.leases_acquired += 1
+                try:
+                    # A peer may have stored the entry and released its lease
+                    # between our miss and this acquire
+                    stored = await self._fresh(namespace, key, max_age)
+                    if stored is not None:
+                        self.peer_fills += 1
+                        return stored, True
+                    return await fetch(), False
+                finally:
+                    try:
+                        await self._run(self._release, namespace, key)
+                    except sqlite3.Error as e:
+                        logger.warning(f"Disk cache lease release failed for {namespace}/{key}: {e}")
+
+            self.lease_waits += 1
+            while True:
+                await asyncio.sleep(self.LEASE_POLL)
+                stored = await self._fresh(namespace, key, max_age)
+                if stored is not None:
+                    self.peer_fills += 1
+                    return stored, True
+                if time.monotonic() >= deadline:
+                    return await fetch(), False
+                try:
+                    held = await self._run(self._lease_held, namespace, key)
+                except sqlite3.Error:
+                    held = False
+                if not held:
+                    # The owner gave up without storing anything; try to take over
+                    break
+
+    async def _fresh(self, namespace: str, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """The stored value if it is within max_age (and the cache's own), else None"""
+        try:
+            row = await self._run(self._select, namespace, key)
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        age = time.time() - row[1]
+        if (self.max_age is not None and age > self.max_age) or (max_age is not None and age > max_age):
+            return None
+        return json.loads(row[0])
+
+    def _lease_held(self, namespace: str, key: str) -> bool:
+        row = self._conn.execute(
+            "SELECT expires_at FROM leases WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+        return row is not None and row[0] >= time.time()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "journal_mode": self.journal_mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "leases_acquired": self.leases_acquired,
+            "lease_waits": self.lease_waits,
+            "peer_fills": self.peer_fills,
+        }
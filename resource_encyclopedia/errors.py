@@ -0,0 +1,16 @@
+"""
+Encyclopedia Errors
+Exceptions shared by the data sources behind PokemonDataResource
+"""
+
+
+class NotFoundError(LookupError):
+    """The requested resource does not exist upstream or in the local dataset"""
+
+    def __init__(self, url: str):
+        super().__init__(f"Not found: {url}")
+        self.url = url
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """PokéAPI is being skipped because the circuit breaker is open"""
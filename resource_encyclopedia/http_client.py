@@ -0,0 +1,164 @@
+"""
+Upstream HTTP Client
+Shared, pooled httpx client used for every PokéAPI call
+"""
+import os
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from resource_encyclopedia.rate_limit import TokenBucket
+from resource_encyclopedia.resilience import ResiliencePolicy
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_host_timeouts(raw: str) -> Dict[str, float]:
+    """Parse 'host=seconds,host=seconds' into a timeout map"""
+    host_timeouts = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        host, seconds = item.split("=", 1)
+        host_timeouts[host.strip().lower()] = float(seconds)
+    return host_timeouts
+
+
+class UpstreamClient:
+    """Long-lived keep-alive client shared across the whole process"""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        host_timeouts: Optional[Dict[str, float]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and self._http2_available()
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.host_timeouts = {host.lower(): seconds for host, seconds in (host_timeouts or {}).items()}
+        self.transport = transport
+        # Retries, hedging and the circuit breaker wrap every request
+        self.resilience = resilience or ResiliencePolicy()
+        # Outbound budget; every attempt, retry and hedge takes a token
+        self.rate_limiter = rate_limiter
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_env(cls) -> "UpstreamClient":
+        """Build a client from POKEAPI_* environment variables"""
+        return cls(
+            max_connections=int(os.environ.get("POKEAPI_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.environ.get("POKEAPI_MAX_KEEPALIVE", "10")),
+            keepalive_expiry=float(os.environ.get("POKEAPI_KEEPALIVE_EXPIRY", "30")),
+            http2=os.environ.get("POKEAPI_HTTP2", "").lower() in ("1", "true", "yes"),
+            timeout=float(os.environ.get("POKEAPI_TIMEOUT", "10")),
+            connect_timeout=float(os.environ.get("POKEAPI_CONNECT_TIMEOUT", "5")),
+            host_timeouts=_parse_host_timeouts(os.environ.get("POKEAPI_HOST_TIMEOUTS", "")),
+            resilience=ResiliencePolicy.from_env(),
+            rate_limiter=TokenBucket.from_env(),
+        )
+
+    @staticmethod
+    def _http2_available() -> bool:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            return False
+        return True
+
+    @property
+    def is_started(self) -> bool:
+        return self._client is not None
+
+    async def start(self) -> None:
+        """Open the shared connection pool"""
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            limits=self.limits,
+            http2=self.http2,
+            timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            follow_redirects=True,
+            transport=self.transport,
+        )
+        logger.info(
+            f"Upstream client started (http2={self.http2}, "
+            f"max_connections={self.limits.max_connections})"
+        )
+
+    async def close(self) -> None:
+        """Close the pool and drop every kept-alive connection"""
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        await client.aclose()
+        logger.info("Upstream client closed")
+
+    def _timeout_for(self, url: str) -> httpx.Timeout:
+        host = (urlsplit(url).hostname or "").lower()
+        seconds = self.host_timeouts.get(host, self.timeout)
+        return httpx.Timeout(seconds, connect=min(self.connect_timeout, seconds))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL over the shared pool, opening it lazily if needed"""
+        if self._client is None:
+            await self.start()
+        kwargs.setdefault("timeout", self._timeout_for(url))
+        return await self.resilience.call(lambda: self._send(url, kwargs))
+
+    async def _send(self, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        return await self._client.get(url, **kwargs)
+
+    async def get_streamed(
+        self, url: str, parse: Callable[[AsyncIterator[bytes]], Awaitable[Any]], **kwargs
+    ) -> Tuple[httpx.Response, Any]:
+        """GET a URL and feed a 200 body to parse() as it arrives, without buffering it.
+
+        Returns the (closed) response and what parse() produced, or None for
+        any other status.
+        """
+        if self._client is None:
+            await self.start()
+        kwargs.setdefault("timeout", self._timeout_for(url))
+        # Hedged attempts each parse their own body; keep the winner's
+        parsed: Dict[httpx.Response, Any] = {}
+
+        async def send() -> httpx.Response:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            request = self._client.build_request("GET", url, **kwargs)
+            response = await self._client.send(request, stream=True)
+            try:
+                if response.status_code == 200:
+                    parsed[response] = await parse(response.aiter_bytes())
+            finally:
+                # Also runs when a losing hedge is cancelled mid-body
+                await response.aclose()
+            return response
+
+        response = await self.resilience.call(send)
+        return response, parsed.get(response)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.resilience.stats(),
+            "rate_limit": self.rate_limiter.stats() if self.rate_limiter is not None else None,
+        }
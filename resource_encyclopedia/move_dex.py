@@ -0,0 +1,209 @@
+"""
+Move Dex
+Every move, bulk-loaded once from the dataset's move table, with secondary
+indexes by type, damage class, ailment and numeric ranges
+
+With a move dex loaded, PokemonDataResource (and through it the battle
+tool) resolves move ids locally instead of fetching /move/<id> per move.
+A dataset swap that keeps the same move ids patches the changed moves in.
+"""
+import copy
+import logging
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from resource_encyclopedia.bitmap_index import (
+    Range, SortedColumn, group_bitmaps, next_cursor, parse_page, parse_ranges, parse_sort, patch_bitmaps, select,
+    split_list,
+)
+from resource_encyclopedia.dataset import LocalDataset
+from resource_encyclopedia.move_table import Move, move_details
+from rule.chart import ALL_TYPES
+
+logger = logging.getLogger(__name__)
+
+# Numeric fields that can be filtered on and sorted by
+FIELDS = ("id", "power", "accuracy", "pp", "priority", "effect_chance")
+CATEGORIES = ("physical", "special", "status")
+# PokéAPI's move-ailment names, so a valid ailment no loaded move has is not an error
+AILMENTS = (
+    "unknown", "none", "paralysis", "sleep", "freeze", "burn", "poison", "confusion", "infatuation",
+    "trap", "nightmare", "torment", "disable", "yawn", "heal-block", "no-type-immunity", "leech-seed",
+    "embargo", "perish-song", "ingrain", "silence", "tar-shot",
+)
+
+
+class MoveQuery(NamedTuple):
+    """Filters, ordering and page of one move dex query"""
+    types: Tuple[str, ...] = ()
+    categories: Tuple[str, ...] = ()
+    ailments: Tuple[str, ...] = ()
+    ranges: Tuple[Range, ...] = ()
+    sort: str = "id"
+    descending: bool = False
+    offset: int = 0
+    limit: int = 20
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any], default_limit: int = 20, max_limit: int = 100) -> "MoveQuery":
+        """Parse flat request parameters: types, categories, ailments (each
+        matching any of the listed values), min_<field>/max_<field>, sort
+        (prefix '-' for descending), limit, cursor
+        """
+        categories = tuple(split_list(params.get("categories")))
+        unknown = [name for name in categories if name not in CATEGORIES]
+        if unknown:
+            raise ValueError(f"Unknown category: {', '.join(unknown)} (expected one of {', '.join(CATEGORIES)})")
+        sort, descending = parse_sort(params, FIELDS)
+        offset, limit = parse_page(params, default_limit, max_limit)
+        return cls(
+            types=tuple(split_list(params.get("types"))),
+            categories=categories,
+            ailments=tuple(split_list(params.get("ailments"))),
+            ranges=parse_ranges(params, FIELDS),
+            sort=sort,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+        )
+
+
+class MoveDex:
+    """Compact records for every move, ordered by id, with bitmap and sorted-column indexes"""
+
+    def __init__(self, payloads: Iterable[Dict[str, Any]]):
+        self.moves: List[Move] = []
+        # Status condition a move can inflict ("none" for most), per row
+        self.ailments: List[Optional[str]] = []
+        for payload in sorted(payloads, key=lambda payload: payload["id"]):
+            move, ailment = self._parse(payload)
+            self.moves.append(move)
+            self.ailments.append(ailment)
+        self.size = len(self.moves)
+        self.all = (1 << self.size) - 1
+        self.rows = {move.id: row for row, move in enumerate(self.moves)}
+        self.names = {move.name: row for row, move in enumerate(self.moves)}
+
+        self.by_type = group_bitmaps([move.type for move in self.moves], self.size)
+        self.by_category = group_bitmaps([move.category for move in self.moves], self.size)
+        self.by_ailment = group_bitmaps(self.ailments, self.size)
+        self.columns = {
+            field: SortedColumn([getattr(move, field) for move in self.moves]) for field in FIELDS
+        }
+
+    @staticmethod
+    def _parse(payload: Dict[str, Any]) -> Tuple[Move, Optional[str]]:
+        move = Move(payload["id"], payload["name"])
+        move.update(move_details(payload))
+        ailment = ((payload.get("meta") or {}).get("ailment") or {}).get("name")
+        return move, sys.intern(ailment) if ailment else None
+
+    def patched(self, dataset: LocalDataset, ids: Iterable[int]) -> Optional["MoveDex"]:
+        """This dex moved onto a newer dataset, re-reading only the moves in `ids`.
+
+        None when the dataset's move ids differ and a full build is needed.
+        Unchanged moves are shared; this dex is left as it is.
+        """
+        table = dataset.tables.get("move")
+        if table is None or len(table.entries) != self.size or any(int(key) not in self.rows for key in table.entries):
+            return None
+        dex = copy.copy(self)
+        dex.moves = list(self.moves)
+        dex.ailments = list(self.ailments)
+        dex.names = dict(self.names)
+        type_changes, category_changes, ailment_changes, field_changes = [], [], [], {field: [] for field in FIELDS}
+        for move_id in sorted(set(ids)):
+            row = self.rows.get(move_id)
+            if row is None:
+                continue
+            old, old_ailment = self.moves[row], self.ailments[row]
+            move, ailment = self._parse(table.entries[str(move_id)])
+            dex.moves[row], dex.ailments[row] = move, ailment
+            if move.name != old.name:
+                if dex.names.get(old.name) == row:
+                    del dex.names[old.name]
+                dex.names[move.name] = row
+            type_changes.append((row, [old.type], [move.type]))
+            category_changes.append((row, [old.category], [move.category]))
+            ailment_changes.append((row, [old_ailment], [ailment]))
+            for field in FIELDS:
+                field_changes[field].append((row, getattr(old, field), getattr(move, field)))
+        dex.by_type = patch_bitmaps(self.by_type, type_changes)
+        dex.by_category = patch_bitmaps(self.by_category, category_changes)
+        dex.by_ailment = patch_bitmaps(self.by_ailment, ailment_changes)
+        dex.columns = {field: column.patched(field_changes[field]) for field, column in self.columns.items()}
+        return dex
+
+    @classmethod
+    def from_dataset(cls, dataset: LocalDataset) -> Optional["MoveDex"]:
+        """The dex for a dataset's move table; None if the dataset has no moves"""
+        table = dataset.tables.get("move")
+        if table is None:
+            return None
+        return cls(table.entries.values())
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["MoveDex"]:
+        """Read just the move table of a dataset directory; this blocks"""
+        dex = cls.from_dataset(LocalDataset.load_tables(directory, ["move"]))
+        if dex is not None:
+            logger.info(f"Loaded move dex with {len(dex)} moves from {directory}")
+        return dex
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, move_id: int) -> bool:
+        return move_id in self.rows
+
+    def __iter__(self) -> Iterator[Move]:
+        return iter(self.moves)
+
+    def get(self, move_id: int) -> Optional[Move]:
+        row = self.rows.get(move_id)
+        return self.moves[row] if row is not None else None
+
+    def find(self, ident: str) -> Optional[Dict[str, Any]]:
+        """One move's record by name or id"""
+        ident = str(ident).strip().lower()
+        row = self.rows.get(int(ident)) if ident.isdigit() else self.names.get(ident)
+        return self.record(row) if row is not None else None
+
+    def record(self, row: int) -> Dict[str, Any]:
+        move = self.moves[row]
+        return {"name": move.name, "id": move.id, **move.details(), "ailment": self.ailments[row]}
+
+    def _any_of(self, bitmaps: Dict[str, int], names: Tuple[str, ...], known, label: str) -> int:
+        unknown = [name for name in names if name not in bitmaps and name not in known]
+        if unknown:
+            raise ValueError(f"Unknown {label}: {', '.join(unknown)}")
+        bits = 0
+        for name in names:
+            bits |= bitmaps.get(name, 0)
+        return bits
+
+    def match(self, query: MoveQuery) -> int:
+        """Bitmap of the rows passing every filter"""
+        bits = self.all
+        if query.types:
+            bits &= self._any_of(self.by_type, query.types, ALL_TYPES, "type")
+        if query.categories:
+            bits &= self._any_of(self.by_category, query.categories, CATEGORIES, "category")
+        if query.ailments:
+            bits &= self._any_of(self.by_ailment, query.ailments, AILMENTS, "ailment")
+        for field, lo, hi in query.ranges:
+            bits &= self.columns[field].range(lo, hi)
+        return bits
+
+    def search(self, query: MoveQuery) -> Dict[str, Any]:
+        """One page of matching move records, in the requested order"""
+        order = self.columns[query.sort].order(query.descending)
+        total, rows = select(self.match(query), self.size, order, query.offset, query.limit)
+        return {
+            "count": total,
+            "moves": [self.record(row) for row in rows],
+            "next_cursor": next_cursor(query.offset, query.limit, total),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {"moves": self.size, "types": len(self.by_type), "ailments": len(self.by_ailment)}
@@ -0,0 +1,137 @@
+"""
+Move Table
+Process-wide interned move records, referenced by id from every Pokémon record
+"""
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def move_details(move_data: Dict[str, Any]) -> Dict[str, Any]:
+    """The public details dict for a (trimmed) /move payload"""
+    return {
+        "type": (move_data.get("type") or {}).get("name", "normal"),
+        "category": (move_data.get("damage_class") or {}).get("name", "physical"),
+        "power": move_data.get("power"),
+        "accuracy": move_data.get("accuracy"),
+        "pp": move_data.get("pp", 0),
+        "priority": move_data.get("priority", 0),
+        "effect_chance": move_data.get("effect_chance"),
+        "effect_entries": [
+            entry["effect"]
+            for entry in move_data.get("effect_entries") or []
+            if entry["language"]["name"] == "en"
+        ][:1],
+    }
+
+
+class Move:
+    """One move's name and details; a single instance per move id per process"""
+
+    __slots__ = (
+        "id", "name", "type", "category", "power", "accuracy", "pp",
+        "priority", "effect_chance", "effect", "placeholder",
+    )
+
+    def __init__(self, move_id: int, name: str):
+        self.id = move_id
+        self.name = sys.intern(name)
+        # Details stay unset until the move is resolved
+        self.type: Optional[str] = None
+        self.category: Optional[str] = None
+        self.power: Optional[int] = None
+        self.accuracy: Optional[int] = None
+        self.pp = 0
+        self.priority = 0
+        self.effect_chance: Optional[int] = None
+        self.effect: Optional[str] = None
+        self.placeholder = False
+
+    @property
+    def resolved(self) -> bool:
+        return self.type is not None
+
+    def update(self, details: Dict[str, Any]) -> None:
+        """Copy in a details dict as built by PokemonDataResource"""
+        # Type and damage class names repeat across hundreds of moves
+        self.type = sys.intern(details.get("type") or "normal")
+        self.category = sys.intern(details.get("category") or "physical")
+        self.power = details.get("power")
+        self.accuracy = details.get("accuracy")
+        self.pp = details.get("pp", 0)
+        self.priority = details.get("priority", 0)
+        self.effect_chance = details.get("effect_chance")
+        effects = details.get("effect_entries") or []
+        self.effect = effects[0] if effects else None
+        self.placeholder = bool(details.get("placeholder"))
+
+    def details(self) -> Dict[str, Any]:
+        """The public details dict for this move"""
+        details = {
+            "type": self.type,
+            "category": self.category,
+            "power": self.power,
+            "accuracy": self.accuracy,
+            "pp": self.pp,
+            "priority": self.priority,
+            "effect_chance": self.effect_chance,
+            "effect_entries": [self.effect] if self.effect else [],
+        }
+        if self.placeholder:
+            details["placeholder"] = True
+        return details
+
+
+class MoveTable:
+    """Move id -> Move. Never evicts: there are under a thousand moves, and
+    cached Pokémon records hold ids that must keep resolving.
+    """
+
+    def __init__(self):
+        self._moves: Dict[int, Move] = {}
+
+    def __len__(self) -> int:
+        return len(self._moves)
+
+    def __contains__(self, move_id: int) -> bool:
+        return move_id in self._moves
+
+    def __getitem__(self, move_id: int) -> Move:
+        return self._moves[move_id]
+
+    def get(self, move_id: int) -> Optional[Move]:
+        return self._moves.get(move_id)
+
+    def ref(self, move_id: int, name: str) -> Move:
+        """The move with this id, adding an unresolved entry the first time it is seen"""
+        move = self._moves.get(move_id)
+        if move is None:
+            move = self._moves[move_id] = Move(move_id, name)
+        return move
+
+    def store(self, move_id: int, details: Dict[str, Any], name: Optional[str] = None) -> Move:
+        """Fill in (or refresh) a move's details"""
+        move = self.ref(move_id, name or str(move_id))
+        # A placeholder never replaces real details already held
+        if details.get("placeholder") and move.resolved and not move.placeholder:
+            return move
+        move.update(details)
+        return move
+
+    def add_all(self, moves: Iterable[Move]) -> None:
+        """Take in already resolved moves (e.g. the move dex's) as the canonical
+        instances; entries held with real details are kept as they are
+        """
+        for move in moves:
+            held = self._moves.get(move.id)
+            if held is None:
+                self._moves[move.id] = move
+            elif not held.resolved or held.placeholder:
+                held.update(move.details())
+
+    def resolve(self, move_ids: Iterable[int]) -> List[Move]:
+        return [self._moves[move_id] for move_id in move_ids]
+
+    def stats(self) -> Dict[str, Any]:
+        resolved = sum(1 for move in self._moves.values() if move.resolved)
+        placeholders = sum(1 for move in self._moves.values() if move.placeholder)
+        return {"entries": len(self._moves), "resolved": resolved, "placeholders": placeholders}
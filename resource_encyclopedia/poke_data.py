@@ -2,53 +2,819 @@
 Pokémon Data Resource
 MCP Resource implementation for Pokémon data access
 """
+import asyncio
+import contextvars
+import time
 import httpx
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
 import logging
+from urllib.parse import urljoin
+
+from resource_encyclopedia.cache import BoundedCache
+from resource_encyclopedia.catalog import VALID_NAME, PokemonCatalog, decode_cursor, encode_cursor, normalize_name
+from resource_encyclopedia.dataset import FIELDS, LocalDataset, parse_resource_url, resource_key, trim_payload
+from resource_encyclopedia.disk_cache import DiskCache
+from resource_encyclopedia.errors import NotFoundError, UpstreamUnavailableError
+from resource_encyclopedia.http_client import UpstreamClient
+from resource_encyclopedia.move_dex import MoveDex, MoveQuery
+from resource_encyclopedia.move_table import Move, MoveTable, move_details
+from resource_encyclopedia.rate_limit import background_priority
+from resource_encyclopedia.single_flight import SingleFlight
+from resource_encyclopedia.snapshots import DatasetSnapshot, diff_datasets
+from resource_encyclopedia.species_index import SpeciesIndex, SpeciesQuery
+from resource_encyclopedia.species_table import SpeciesTable
+from resource_encyclopedia.warmup import AccessLog
+from rule.chart import TypeChart
 
 logger = logging.getLogger(__name__)
 
+# Failures that mean PokéAPI is degraded rather than that the data is bad
+UPSTREAM_ERRORS = (UpstreamUnavailableError, httpx.TransportError, httpx.HTTPStatusError)
+
+# Returned by a conditional request when PokéAPI answers 304
+NOT_MODIFIED = object()
+
+
+class LoadProfile(NamedTuple):
+    """How much of a Pokémon record to resolve beyond the /pokemon payload itself"""
+    name: str
+    move_details: int
+    species: bool
+    evolution_chain: bool
+
+    def covers(self, other: "LoadProfile") -> bool:
+        return (
+            self.move_details >= other.move_details
+            and self.species >= other.species
+            and self.evolution_chain >= other.evolution_chain
+        )
+
 
 class PokemonDataResource:
-    def __init__(self):
+    # Moves resolved eagerly with full details; the rest of the movepool pages in lazily
+    MOVE_DETAIL_LIMIT = 20
+    # battle: stats, types and 4 moves; summary: adds generation and evolutions, no moves
+    PROFILES = {
+        "battle": LoadProfile("battle", 4, False, False),
+        "summary": LoadProfile("summary", 0, True, True),
+        "full": LoadProfile("full", MOVE_DETAIL_LIMIT, True, True),
+    }
+    # How long the name catalog is trusted, and how long to wait after a failed load
+    CATALOG_TTL = 24 * 3600
+    CATALOG_RETRY_AFTER = 60
+    # Records built while PokéAPI was degraded are kept briefly and never persisted
+    DEGRADED_TTL = 60
+
+    def __init__(
+        self,
+        http_client: Optional[UpstreamClient] = None,
+        max_concurrent_fetches: int = 10,
+        cache: Optional[BoundedCache] = None,
+        move_cache: Optional[BoundedCache] = None,
+        species_cache: Optional[BoundedCache] = None,
+        evolution_cache: Optional[BoundedCache] = None,
+        negative_cache: Optional[BoundedCache] = None,
+        payload_cache: Optional[BoundedCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        dataset: Optional[LocalDataset] = None,
+        species_table: Optional[SpeciesTable] = None,
+        access_log: Optional[AccessLog] = None,
+        move_table: Optional[MoveTable] = None,
+        move_dex: Optional[MoveDex] = None,
+    ):
         self.base_url = "https://pokeapi.co/api/v2"
-        self.cache = {}
-        self.move_cache = {}
+        self.http_client = http_client or UpstreamClient()
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
+        self.cache = cache if cache is not None else BoundedCache(
+            max_entries=1000, ttl=24 * 3600, policy="tinylfu", stale_ttl=24 * 3600
+        )
+        # Freshness of each move (TTL, stale window, revalidation); holds just the move id,
+        # the details live once in move_table
+        self.move_cache = move_cache if move_cache is not None else BoundedCache(
+            max_entries=2000, ttl=24 * 3600, stale_ttl=24 * 3600
+        )
+        # Canonical move records; Pokémon records hold move ids into this table
+        self.move_table = move_table if move_table is not None else MoveTable()
+        # Every move loaded in bulk (offline: from the dataset); resolves move ids with no fetch per move
+        self.move_dex = move_dex if move_dex is not None or dataset is None else MoveDex.from_dataset(dataset)
+        if self.move_dex is not None:
+            self.move_table.add_all(self.move_dex)
+        # Shared per family/species, keyed by canonical 'kind/id' so forms and
+        # evolution-line members reuse one download and one chain walk
+        self.species_cache = species_cache if species_cache is not None else BoundedCache(
+            max_entries=1200, ttl=24 * 3600, stale_ttl=24 * 3600
+        )
+        self.evolution_cache = evolution_cache if evolution_cache is not None else BoundedCache(
+            max_entries=600, ttl=24 * 3600, stale_ttl=24 * 3600
+        )
+        # Names that recently 404'd; short TTL so new releases are picked up
+        self.negative_cache = negative_cache if negative_cache is not None else BoundedCache(
+            max_entries=5000, ttl=300
+        )
+        # Trimmed /pokemon payloads, so a record can be upgraded to a bigger profile without refetching
+        self.payload_cache = payload_cache if payload_cache is not None else BoundedCache(
+            max_entries=1000, ttl=24 * 3600
+        )
+        # Optional write-through L2 that survives restarts
+        self.disk_cache = disk_cache
+        # Offline mode: every lookup is answered from the live dataset snapshot, never the network
+        self._snapshot = DatasetSnapshot(dataset, species_table) if dataset is not None else None
+        # Shared read-only base stats/types for every species, mapped from disk
+        self._species_table = species_table
+        # Query indexes over a species table used without a snapshot, built on first use
+        self._species_index: Optional[SpeciesIndex] = None
+        # The snapshot a request started on; it keeps reading that one across a swap
+        self._pinned: contextvars.ContextVar = contextvars.ContextVar(f"snapshot_{id(self)}", default=None)
+        self.snapshot_stats = {"swaps": 0, "changed_entries": 0, "rebuilt_records": 0, "last_swap_seconds": None}
+        # Concurrent misses on one key (name or URL) share a single fetch
+        self._inflight = SingleFlight()
+        self._catalog: Optional[PokemonCatalog] = None
+        self._catalog_loaded_at = 0.0
+        self._catalog_failed_at = 0.0
+        self.rejected_names = 0
+        self.type_chart = TypeChart()
+        # Request counts that pick the next startup's warm-up set
+        self.access_log = access_log
+        # ETag / Last-Modified per upstream URL, for conditional revalidation
+        self.validators = BoundedCache(max_entries=10000)
+        # Background refreshes of stale entries, one per (namespace, key)
+        self._refreshing: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.refresh_stats = {"scheduled": 0, "not_modified": 0, "modified": 0, "failed": 0}
+        self.degraded_stats = {"stale_fallbacks": 0, "placeholder_moves": 0, "partial_records": 0}
+
+    async def _fetch_json(self, url: str) -> Dict[str, Any]:
+        """GET an upstream URL, collapsing concurrent requests for the same URL"""
+        # Trimmed payloads carry host-relative URLs
+        url = urljoin(self.base_url, url)
+        return await self._flight(("url", url), lambda: self._request_json(url))
 
-    async def get_pokemon_data(self, pokemon_name: str) -> Dict[str, Any]:
-        """Get comprehensive Pokémon data"""
-        if pokemon_name in self.cache:
-            return self.cache[pokemon_name]
+    async def _request_json(self, url: str, conditional: bool = False) -> Any:
+        """GET an upstream URL under the shared concurrency bound.
 
+        With conditional=True the stored validators are sent and a 304
+        returns NOT_MODIFIED instead of a body.
+        """
+        if self.dataset is not None:
+            return self.dataset.resolve(url)
+        headers = {}
+        validator = self.validators.get(url) if conditional else None
+        if validator is not None:
+            etag, last_modified = validator
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        if self._fetch_semaphore is None:
+            self._fetch_semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+        # Large single-resource bodies are parsed down to the fields we use as they stream in
+        kind, ident, _ = parse_resource_url(url)
+        fields = FIELDS.get(kind) if ident else None
+        body = None
+        async with self._fetch_semaphore:
+            if fields is None:
+                response = await self.http_client.get(url, headers=headers)
+            else:
+                response, body = await self.http_client.get_streamed(url, fields.parse, headers=headers)
+        if response.status_code == 304 and validator is not None:
+            return NOT_MODIFIED
+        if response.status_code == 404:
+            raise NotFoundError(url)
+        response.raise_for_status()
+        etag, last_modified = response.headers.get("etag"), response.headers.get("last-modified")
+        if etag or last_modified:
+            self.validators[url] = (etag, last_modified)
+        return response.json() if fields is None else body
+
+    @property
+    def snapshot(self) -> Optional[DatasetSnapshot]:
+        """The dataset snapshot this request reads: the one it started on, else the live one"""
+        return self._pinned.get() or self._snapshot
+
+    @property
+    def dataset(self) -> Optional[LocalDataset]:
+        snapshot = self.snapshot
+        return snapshot.dataset if snapshot is not None else None
+
+    @property
+    def species_table(self) -> Optional[SpeciesTable]:
+        snapshot = self.snapshot
+        return snapshot.species_table if snapshot is not None else self._species_table
+
+    @property
+    def dataset_version(self) -> Optional[str]:
+        return self._snapshot.version if self._snapshot is not None else None
+
+    @contextmanager
+    def _pin(self, snapshot: Optional[DatasetSnapshot] = None) -> Iterator[None]:
+        """Read one snapshot for the rest of this call, including tasks it starts"""
+        if snapshot is None:
+            # Nested calls keep the snapshot their outermost call started on
+            snapshot = self._pinned.get() or self._snapshot
+        if snapshot is None:
+            yield
+            return
+        token = self._pinned.set(snapshot)
+        snapshot.pin()
         try:
-            async with httpx.AsyncClient() as client:
-                pokemon_response = await client.get(f"{self.base_url}/pokemon/{pokemon_name}")
-                pokemon_response.raise_for_status()
-                pokemon_data = pokemon_response.json()
-
-                species_response = await client.get(pokemon_data["species"]["url"])
-                species_response.raise_for_status()
-                species_data = species_response.json()
-
-                evolution_data = None
-                if species_data.get("evolution_chain"):
-                    evolution_response = await client.get(species_data["evolution_chain"]["url"])
-                    evolution_response.raise_for_status()
-                    evolution_data = evolution_response.json()
-
-                processed_data = await self._process_pokemon_data(pokemon_data, species_data, evolution_data)
-                self.cache[pokemon_name] = processed_data
-                return processed_data
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise ValueError(f"Pokémon '{pokemon_name}' not found")
+            yield
+        finally:
+            self._pinned.reset(token)
+            snapshot.unpin()
+
+    def _is_live(self) -> bool:
+        pinned = self._pinned.get()
+        return pinned is None or pinned is self._snapshot
+
+    def _diverged(self, namespace: str, key: str) -> bool:
+        """Whether the shared caches may hold another snapshot's value for this key"""
+        if self._is_live():
+            return False
+        pinned, live = self._pinned.get(), self._snapshot
+        if pinned.parent == live.version:
+            # A candidate being prepared for a swap
+            return (namespace, key) in pinned.changes
+        if live.parent == pinned.version:
+            # A request that started just before the last swap
+            return (namespace, key) in live.changes
+        return True
+
+    def _cached(self, namespace: str, cache: BoundedCache, key: str) -> Tuple[Any, bool]:
+        """(value, stale) from a cache, as seen by this request's snapshot"""
+        if self._diverged(namespace, key):
+            staged = self._pinned.get().staged.get((namespace, key))
+            return (staged[0] if staged is not None else None), False
+        return cache.get_or_stale(key)
+
+    def _cache_set(self, namespace: str, cache: BoundedCache, key: str, value: Any,
+                   ttl: Optional[float] = None) -> None:
+        if self._is_live():
+            cache.set(key, value, ttl=ttl)
+        else:
+            # Built on a snapshot that is not live: keep it out of the shared caches
+            self._pinned.get().staged[(namespace, key)] = (value, ttl)
+
+    async def _flight(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """SingleFlight.do, never sharing a call between requests on different snapshots"""
+        snapshot = self.snapshot
+        return await self._inflight.do(key if snapshot is None else (snapshot.version, key), fn)
+
+    def _serve(self, cache: BoundedCache, key: str, namespace: str, url: str,
+               rebuild: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Cached value (fresh or stale) or None; a stale value triggers a background refresh"""
+        value, stale = self._cached(namespace, cache, key)
+        if stale:
+            self._schedule_refresh(cache, key, namespace, url, value, rebuild)
+        return value
+
+    def _schedule_refresh(self, cache: BoundedCache, key: str, namespace: str, url: str, value: Any,
+                          rebuild: Callable[[Any], Awaitable[Any]]) -> None:
+        if (namespace, key) in self._refreshing:
+            return
+        self.refresh_stats["scheduled"] += 1
+        task = asyncio.create_task(self._refresh(cache, key, namespace, url, value, rebuild))
+        self._refreshing[(namespace, key)] = task
+        task.add_done_callback(lambda _: self._refreshing.pop((namespace, key), None))
+
+    async def _refresh(self, cache: BoundedCache, key: str, namespace: str, url: str, value: Any,
+                       rebuild: Callable[[Any], Awaitable[Any]]) -> None:
+        """Revalidate one stale entry: keep it on 304, rebuild it from the new body otherwise"""
+        url = urljoin(self.base_url, url)
+        try:
+            with background_priority():
+                payload = await self._flight(
+                    ("revalidate", url), lambda: self._request_json(url, conditional=True)
+                )
+                if payload is NOT_MODIFIED or self.offline:
+                    self.refresh_stats["not_modified"] += 1
+                    self._cache_set(namespace, cache, key, value)
+                    if self.disk_cache is not None:
+                        await self.disk_cache.put(namespace, key, self._disk_value(namespace, value))
+                else:
+                    self.refresh_stats["modified"] += 1
+                    await rebuild(payload)
+        except Exception as e:
+            # The stale value keeps being served until its grace period ends
+            self.refresh_stats["failed"] += 1
+            logger.warning(f"Background refresh of {namespace}/{key} failed: {e}")
+
+    @property
+    def offline(self) -> bool:
+        return self._snapshot is not None
+
+    async def get_pokemon_data(self, pokemon_name: str, profile: str = "full") -> Dict[str, Any]:
+        """Get comprehensive Pokémon data, resolved as far as the load profile needs"""
+        return self.serialize(await self.get_pokemon_record(pokemon_name, profile))
+
+    async def get_pokemon_record(self, pokemon_name: str, profile: str = "full") -> Dict[str, Any]:
+        """The cached record itself, with moves as ids into move_table; do not mutate it"""
+        pokemon_name = normalize_name(pokemon_name)
+        record = await self.prefetch(pokemon_name, profile)
+        if self.access_log is not None:
+            self.access_log.record(pokemon_name)
+        return record
+
+    def serialize(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Expand a record's move ids into the public move and movepool entries"""
+        data = dict(record)
+        data["moves"] = [
+            {"name": move.name, "id": move.id, "details": move.details()}
+            for move in self.move_table.resolve(record["moves"])
+        ]
+        data["movepool"] = [
+            {"name": move.name, "id": move.id} for move in self.move_table.resolve(record["movepool"])
+        ]
+        return data
+
+    def _intern_record(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Turn a serialized record back into a cached one; None if it predates move ids"""
+        if "movepool" not in data or any("id" not in move for move in data["moves"]):
+            return None
+        for move in data["movepool"]:
+            self.move_table.ref(move["id"], move["name"])
+        for move in data["moves"]:
+            if not self.move_table.ref(move["id"], move["name"]).resolved:
+                self.move_table.store(move["id"], move["details"])
+        return {
+            **data,
+            "moves": [move["id"] for move in data["moves"]],
+            "movepool": [move["id"] for move in data["movepool"]],
+        }
+
+    def _disk_value(self, namespace: str, value: Any) -> Any:
+        # Pokémon records and moves go to disk expanded, so they stay readable without the move table
+        if namespace == "pokemon":
+            return self.serialize(value)
+        if namespace == "move":
+            return self._move_details_of(value)
+        return value
+
+    def _keep_stored(self, namespace: str, cache: Optional[BoundedCache], key: str, value: Any,
+                     ttl: Optional[float] = None) -> None:
+        """Cache a value read back from the disk cache"""
+        if namespace == "move":
+            self._cache_move(key, value, ttl=ttl)
+        elif cache is not None:
+            cache.set(key, value, ttl=ttl)
+
+    async def prefetch(self, pokemon_name: str, profile: str = "full") -> Dict[str, Any]:
+        """Load a Pokémon into the caches without counting it as a user request"""
+        if profile not in self.PROFILES:
+            raise ValueError(f"Unknown load profile: {profile}")
+        with self._pin():
+            return await self._prefetch(normalize_name(pokemon_name), profile)
+
+    async def _prefetch(self, pokemon_name: str, profile: str) -> Dict[str, Any]:
+        # A refresh only runs after `cached` is bound, and rebuilds to the profile it had
+        cached = self._serve(
+            self.cache, pokemon_name, "pokemon", self._pokemon_url(pokemon_name),
+            lambda payload: self._rebuild_pokemon_data(pokemon_name, payload, self._profile_of(cached))
+        )
+        if cached is not None:
+            if self._profile_of(cached).covers(self.PROFILES[profile]):
+                return cached
+            profile = self._upgrade_target(cached, profile)
+        else:
+            await self._validate_name(pokemon_name)
+        return await self._flight(
+            ("pokemon", pokemon_name, profile), lambda: self._load_pokemon_data(pokemon_name, profile)
+        )
+
+    def _profile_of(self, record: Dict[str, Any]) -> LoadProfile:
+        # Records stored before profiles existed were always fully resolved
+        return self.PROFILES[record.get("profile", "full")]
+
+    def _upgrade_target(self, record: Dict[str, Any], profile: str) -> str:
+        """Smallest named profile covering both what a record has and what is wanted"""
+        wanted = self.PROFILES[profile]
+        return profile if wanted.covers(self._profile_of(record)) else "full"
+
+    async def _load_pokemon_data(self, pokemon_name: str, profile: str = "full") -> Dict[str, Any]:
+        """Fetch and process a Pokémon that is not cached yet, or not to this profile"""
+        if self.disk_cache is not None:
+            stored = await self.disk_cache.get("pokemon", pokemon_name)
+            if stored is not None:
+                stored = self._intern_record(stored)
+            if stored is not None:
+                if self._profile_of(stored).covers(self.PROFILES[profile]):
+                    self.cache[pokemon_name] = stored
+                    return stored
+                profile = self._upgrade_target(stored, profile)
+
+        try:
+            # Hop 1: the Pokémon itself; everything else depends on it
+            pokemon_data = await self._get_pokemon_payload(pokemon_name)
+            return await self._build_pokemon_data(pokemon_name, pokemon_data, self.PROFILES[profile])
+
+        except NotFoundError:
+            self._cache_set("negative", self.negative_cache, pokemon_name, True)
+            raise ValueError(f"Pokémon '{pokemon_name}' not found")
+        except UPSTREAM_ERRORS as e:
+            stale = await self._stale_fallback("pokemon", pokemon_name, self.cache, self._intern_record)
+            if stale is not None:
+                return stale
+            if isinstance(e, UpstreamUnavailableError):
+                raise ValueError(f"PokéAPI is unavailable: {e}")
             raise ValueError(f"Error fetching Pokémon data: {e}")
         except Exception as e:
             raise ValueError(f"Error processing Pokémon data: {e}")
 
-    async def _process_pokemon_data(
-        self, pokemon_data: Dict, species_data: Dict, evolution_data: Optional[Dict]
+    async def _stale_fallback(self, namespace: str, key: str, cache: BoundedCache,
+                              decode: Optional[Callable[[Any], Any]] = None) -> Optional[Any]:
+        """Last stored copy of an entry, however old, while PokéAPI is failing"""
+        if self.disk_cache is None:
+            return None
+        value = await self.disk_cache.get(namespace, key, allow_expired=True)
+        if value is not None and decode is not None:
+            value = decode(value)
+        if value is not None:
+            self.degraded_stats["stale_fallbacks"] += 1
+            logger.warning(f"Serving stored {namespace}/{key} while PokéAPI is failing")
+            self._keep_stored(namespace, cache, key, value, ttl=self.DEGRADED_TTL)
+        return value
+
+    def _pokemon_url(self, pokemon_name: str) -> str:
+        return f"{self.base_url}/pokemon/{pokemon_name}"
+
+    async def _get_pokemon_payload(self, pokemon_name: str) -> Dict[str, Any]:
+        """Trimmed /pokemon payload: memory, then disk, then upstream"""
+        payload = self._cached("pokemon_payload", self.payload_cache, pokemon_name)[0]
+        if payload is None and self.disk_cache is not None:
+            payload = await self.disk_cache.get("pokemon_payload", pokemon_name)
+            if payload is not None:
+                self.payload_cache[pokemon_name] = payload
+        if payload is None:
+            payload = await self._fetch_shared(
+                "pokemon_payload", pokemon_name, self._pokemon_url(pokemon_name), self.payload_cache,
+                lambda body: self._store_pokemon_payload(pokemon_name, body),
+            )
+        return payload
+
+    async def _fetch_shared(self, namespace: str, key: str, url: str, cache: Optional[BoundedCache],
+                            store: Callable[[Dict[str, Any]], Awaitable[Any]],
+                            max_age: Optional[float] = None) -> Any:
+        """Fetch and store an entry once per host: other workers wait for it to land in the disk cache"""
+        async def fetch() -> Any:
+            return await store(await self._fetch_json(url))
+
+        if self.disk_cache is None:
+            return await fetch()
+        value, from_peer = await self.disk_cache.single_flight(namespace, key, fetch, max_age=max_age)
+        if from_peer:
+            self._keep_stored(namespace, cache, key, value)
+        return value
+
+    async def _store_pokemon_payload(self, pokemon_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        payload = trim_payload("pokemon", payload)
+        self._cache_set("pokemon_payload", self.payload_cache, pokemon_name, payload)
+        if self.disk_cache is not None:
+            await self.disk_cache.put("pokemon_payload", pokemon_name, payload)
+        return payload
+
+    async def _rebuild_pokemon_data(self, pokemon_name: str, payload: Dict[str, Any],
+                                    profile: LoadProfile) -> Dict[str, Any]:
+        """Rebuild a record from a freshly downloaded /pokemon body"""
+        pokemon_data = await self._store_pokemon_payload(pokemon_name, payload)
+        return await self._build_pokemon_data(pokemon_name, pokemon_data, profile)
+
+    async def _build_pokemon_data(self, pokemon_name: str, pokemon_data: Dict[str, Any],
+                                  profile: LoadProfile) -> Dict[str, Any]:
+        """Resolve what the profile needs from a /pokemon payload, then store the record"""
+        # Hops 2-3: species -> evolution chain runs alongside the move fan-out
+        movepool = self._movepool(pokemon_data)
+        species_branch = (
+            self._fetch_species_branch(pokemon_data["species"]["url"], profile.evolution_chain)
+            if profile.species else self._no_species()
+        )
+        (species_data, evolution_chain), moves = await asyncio.gather(
+            species_branch,
+            asyncio.gather(*(self._get_move(move_id) for move_id in movepool[:profile.move_details])),
+        )
+
+        processed_data = self._process_pokemon_data(pokemon_data, species_data, evolution_chain, moves, movepool)
+        processed_data["profile"] = profile.name
+        partial = profile.species and not species_data
+        if partial or any(move.placeholder for move in moves):
+            # Partial record: keep it just long enough to absorb a burst, then rebuild
+            self.degraded_stats["partial_records"] += 1
+            self._cache_set("pokemon", self.cache, pokemon_name, processed_data, ttl=self.DEGRADED_TTL)
+            return processed_data
+        self._cache_set("pokemon", self.cache, pokemon_name, processed_data)
+        if self.disk_cache is not None:
+            await self.disk_cache.put("pokemon", pokemon_name, self.serialize(processed_data))
+        return processed_data
+
+    async def _validate_name(self, pokemon_name: str) -> None:
+        """Reject unknown names locally, before any upstream request goes out"""
+        if not VALID_NAME.match(pokemon_name) or pokemon_name in self.negative_cache:
+            self.rejected_names += 1
+            raise ValueError(f"Pokémon '{pokemon_name}' not found")
+        catalog = await self.get_catalog()
+        if catalog is not None and pokemon_name not in catalog:
+            self.rejected_names += 1
+            self._cache_set("negative", self.negative_cache, pokemon_name, True)
+            raise ValueError(f"Pokémon '{pokemon_name}' not found")
+
+    async def get_catalog(self) -> Optional[PokemonCatalog]:
+        """Index of valid names/ids; None while it cannot be loaded"""
+        now = time.monotonic()
+        if self._catalog is not None and now - self._catalog_loaded_at < self.CATALOG_TTL:
+            return self._catalog
+        if self._catalog is None and now - self._catalog_failed_at < self.CATALOG_RETRY_AFTER:
+            return None
+        try:
+            self._catalog = await self._flight("catalog", self._load_catalog)
+            self._catalog_loaded_at = time.monotonic()
+        except Exception as e:
+            # Keep serving with the previous index (or none) rather than failing lookups
+            logger.warning(f"Pokémon catalog load failed: {e}")
+            self._catalog_failed_at = time.monotonic()
+        return self._catalog
+
+    async def _load_catalog(self) -> PokemonCatalog:
+        if self.species_table is not None:
+            return PokemonCatalog.from_species_table(self.species_table)
+        url = f"{self.base_url}/pokemon?limit=100000"
+        if self.disk_cache is None or self.offline:
+            catalog = PokemonCatalog.from_listing(await self._fetch_json(url))
+        else:
+            # One worker per host downloads the listing; the rest read its (name, id) pairs from disk
+            stored = await self.disk_cache.get_entry("catalog", "pokemon")
+            if stored is not None and time.time() - stored[1] <= self.CATALOG_TTL:
+                entries = stored[0]
+            else:
+                entries = await self._fetch_shared("catalog", "pokemon", url, None, self._store_catalog,
+                                                   max_age=self.CATALOG_TTL)
+            catalog = PokemonCatalog((name, ident) for name, ident in entries)
+        logger.info(f"Loaded Pokémon catalog with {len(catalog)} names")
+        return catalog
+
+    async def _store_catalog(self, listing: Dict[str, Any]) -> List[List[Any]]:
+        entries = [[item["name"], int(parse_resource_url(item["url"])[1])] for item in listing["results"]]
+        await self.disk_cache.put("catalog", "pokemon", entries)
+        return entries
+
+    async def swap_snapshot(self, snapshot: DatasetSnapshot) -> Dict[str, Any]:
+        """Make a newly loaded dataset snapshot live without dropping the caches.
+
+        Cached records and moves the new snapshot changes are rebuilt against
+        it first, and the query indexes patched for them; the swap itself has no await, so each request sees either
+        all old or all new data. Requests already running finish on the
+        snapshot they started on.
+        """
+        live = self._snapshot
+        if live is None:
+            raise ValueError("Dataset snapshots can only be swapped in offline mode")
+        started = time.monotonic()
+        snapshot.parent = live.version
+        snapshot.changes = await asyncio.to_thread(diff_datasets, live.dataset, snapshot.dataset)
+        with self._pin(snapshot):
+            rebuilt = await self._prepare_snapshot(snapshot)
+            catalog = await self._load_catalog()
+        species_index, move_dex, new_moves = await asyncio.to_thread(self._patch_indexes, live, snapshot)
+        if self._snapshot is not live:
+            raise ValueError(f"Dataset {self._snapshot.version} was swapped in while {snapshot.version} was prepared")
+        self._install_snapshot(snapshot, catalog)
+        snapshot.species_index = species_index
+        # Requests still on the old snapshot keep its table mapped until they finish
+        live.retire()
+        # After the staged moves, so changed moves keep their rebuilt details
+        self.move_dex = move_dex
+        self.move_table.add_all(new_moves)
+
+        elapsed = time.monotonic() - started
+        self.snapshot_stats["swaps"] += 1
+        self.snapshot_stats["changed_entries"] += len(snapshot.changes)
+        self.snapshot_stats["rebuilt_records"] += rebuilt
+        self.snapshot_stats["last_swap_seconds"] = round(elapsed, 3)
+        logger.info(f"Swapped dataset {live.version} -> {snapshot.version}: {len(snapshot.changes)} changed "
+                    f"entries, {rebuilt} records rebuilt in {elapsed:.2f}s")
+        return {"from": live.version, "to": snapshot.version, "changed_entries": len(snapshot.changes),
+                "rebuilt_records": rebuilt}
+
+    def _patch_indexes(self, live: DatasetSnapshot,
+                       snapshot: DatasetSnapshot) -> Tuple[Optional[SpeciesIndex], Optional[MoveDex], List[Move]]:
+        """The species index and move dex for a snapshot, and the moves to add to the move table.
+
+        The live ones are patched for the snapshot's changed entries when their
+        rows line up; otherwise the dex is rebuilt and the species index left to
+        be built on first use. This blocks, so run it off the event loop.
+        """
+        pokemon_ids = [int(key) for namespace, key in snapshot.changes if namespace == "pokemon" and key.isdigit()]
+        move_ids = [int(key.split("/")[1]) for namespace, key in snapshot.changes if namespace == "move"]
+        species_index = None
+        if live.species_index is not None and snapshot.species_table is not None:
+            species_index = live.species_index.patched(snapshot.species_table, pokemon_ids)
+        move_dex = self.move_dex.patched(snapshot.dataset, move_ids) if self.move_dex is not None else None
+        if move_dex is not None:
+            return species_index, move_dex, [move_dex.get(move_id) for move_id in move_ids if move_id in move_dex]
+        move_dex = MoveDex.from_dataset(snapshot.dataset)
+        return species_index, move_dex, list(move_dex) if move_dex is not None else []
+
+    async def _prepare_snapshot(self, snapshot: DatasetSnapshot) -> int:
+        """Rebuild the cached records and moves a snapshot changes; results are staged on it"""
+        rebuilt = 0
+        for namespace, key in sorted(snapshot.changes):
+            if namespace == "pokemon" and key in self.cache:
+                profile = self._profile_of(self.cache.peek(key)).name
+                try:
+                    await self._load_pokemon_data(key, profile)
+                    rebuilt += 1
+                except ValueError as e:
+                    logger.info(f"Dropping {key} from the caches in dataset {snapshot.version}: {e}")
+            elif namespace == "move":
+                move = self.move_table.get(int(key.split("/")[1]))
+                if move is not None and move.resolved:
+                    await self._get_move(move.id)
+        return rebuilt
+
+    def _install_snapshot(self, snapshot: DatasetSnapshot, catalog: PokemonCatalog) -> None:
+        """Make a prepared snapshot live in one step"""
+        caches = {
+            "pokemon": self.cache,
+            "pokemon_payload": self.payload_cache,
+            "species": self.species_cache,
+            "evolution_chain": self.evolution_cache,
+            "move": self.move_cache,
+            "negative": self.negative_cache,
+        }
+        # A name missing from the old dataset may exist in the new one
+        self.negative_cache.clear()
+        # Changed entries nothing rebuilt are dropped and load again on demand
+        for namespace, key in snapshot.changes:
+            caches[namespace].pop(key)
+        for (namespace, key), (value, ttl) in snapshot.staged.items():
+            if namespace == "move":
+                value = self.move_table.store(int(key.split("/")[1]), self._move_details_of(value)).id
+            caches[namespace].set(key, value, ttl=ttl)
+        snapshot.staged = {}
+        self._catalog = catalog
+        self._catalog_loaded_at = time.monotonic()
+        self._snapshot = snapshot
+
+    def species_index(self) -> SpeciesIndex:
+        """Secondary indexes over the species table this request reads"""
+        table = self.species_table
+        if table is None:
+            raise ValueError("Pokémon queries need a species table "
+                             "(build one with python -m resource_encyclopedia.dataset)")
+        snapshot = self.snapshot
+        if snapshot is None:
+            if self._species_index is None:
+                self._species_index = SpeciesIndex(table)
+            return self._species_index
+        # Kept on the snapshot, so requests pinned to a retired one reuse its index too
+        if snapshot.species_index is None:
+            snapshot.species_index = SpeciesIndex(table)
+        return snapshot.species_index
+
+    async def query_pokemon(self, query: SpeciesQuery) -> Dict[str, Any]:
+        """One page of species matching type, generation and stat filters, from local indexes"""
+        return self.species_index().search(query)
+
+    def _move_dex(self) -> MoveDex:
+        if self.move_dex is None:
+            raise ValueError("Move queries need a move dex "
+                             "(build a dataset with python -m resource_encyclopedia.dataset)")
+        return self.move_dex
+
+    async def query_moves(self, query: MoveQuery) -> Dict[str, Any]:
+        """One page of moves matching type, category, ailment and numeric filters, from the move dex"""
+        return self._move_dex().search(query)
+
+    async def find_move(self, ident: str) -> Dict[str, Any]:
+        """One move dex record by move name or id"""
+        record = self._move_dex().find(ident)
+        if record is None:
+            raise ValueError(f"Move '{ident}' not found")
+        return record
+
+    def purge_expired(self) -> Dict[str, int]:
+        """Drop entries past their stale window from every in-memory cache; counts per cache"""
+        caches = {
+            "pokemon": self.cache,
+            "moves": self.move_cache,
+            "species": self.species_cache,
+            "evolution_chains": self.evolution_cache,
+            "payloads": self.payload_cache,
+            "negative": self.negative_cache,
+        }
+        return {name: cache.purge_expired() for name, cache in caches.items()}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit, miss and eviction counters for every cache layer"""
+        stats = {
+            "pokemon": self.cache.stats(),
+            "moves": self.move_cache.stats(),
+            "species": self.species_cache.stats(),
+            "evolution_chains": self.evolution_cache.stats(),
+            "payloads": self.payload_cache.stats(),
+            "move_table": self.move_table.stats(),
+            "move_dex": self.move_dex.stats() if self.move_dex is not None else None,
+            "negative": {**self.negative_cache.stats(), "rejected_names": self.rejected_names},
+            "refresh": {**self.refresh_stats, "in_flight": len(self._refreshing)},
+            "degraded": self.degraded_stats,
+            "upstream": self.http_client.stats(),
+        }
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats()
+        if self._snapshot is not None:
+            stats["snapshot"] = {"version": self._snapshot.version, **self.snapshot_stats}
+        return stats
+
+    @staticmethod
+    async def _no_species() -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        return {}, []
+
+    async def _fetch_species_branch(self, species_url: str,
+                                    evolution: bool = True) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Fetch species then its evolution chain, degrading to partial data on failure"""
+        try:
+            species_data = await self._get_species(species_url)
+        except Exception as e:
+            logger.warning(f"Species fetch failed for {species_url}: {e}")
+            return {}, []
+
+        evolution_chain = []
+        if evolution and species_data.get("evolution_chain"):
+            try:
+                evolution_chain = await self._get_evolution_chain(species_data["evolution_chain"]["url"])
+            except Exception as e:
+                logger.warning(f"Evolution chain fetch failed for {species_url}: {e}")
+        return species_data, evolution_chain
+
+    async def _get_species(self, species_url: str) -> Dict[str, Any]:
+        """Trimmed species payload, shared by every form of the species"""
+        key = resource_key(species_url)
+        cached = self._serve(self.species_cache, key, "species", species_url,
+                             lambda payload: self._store_species(key, payload))
+        if cached is not None:
+            return cached
+        return await self._flight(("species", key), lambda: self._load_species(key, species_url))
+
+    async def _load_species(self, key: str, species_url: str) -> Dict[str, Any]:
+        species_data = None
+        if self.disk_cache is not None:
+            species_data = await self.disk_cache.get("species", key)
+        if species_data is None:
+            try:
+                return await self._fetch_shared("species", key, species_url, self.species_cache,
+                                                lambda payload: self._store_species(key, payload))
+            except UPSTREAM_ERRORS:
+                species_data = await self._stale_fallback("species", key, self.species_cache)
+                if species_data is None:
+                    raise
+                return species_data
+        self.species_cache[key] = species_data
+        return species_data
+
+    async def _store_species(self, key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        species_data = trim_payload("pokemon-species", payload)
+        self._cache_set("species", self.species_cache, key, species_data)
+        if self.disk_cache is not None:
+            await self.disk_cache.put("species", key, species_data)
+        return species_data
+
+    async def _get_evolution_chain(self, chain_url: str) -> List[Dict[str, Any]]:
+        """Processed evolution chain, walked once per family"""
+        key = resource_key(chain_url)
+        cached = self._serve(self.evolution_cache, key, "evolution_chain", chain_url,
+                             lambda payload: self._store_evolution_chain(key, payload))
+        if cached is not None:
+            return cached
+        return await self._flight(("evolution", key), lambda: self._load_evolution_chain(key, chain_url))
+
+    async def _load_evolution_chain(self, key: str, chain_url: str) -> List[Dict[str, Any]]:
+        evolution_chain = None
+        if self.disk_cache is not None:
+            evolution_chain = await self.disk_cache.get("evolution_chain", key)
+        if evolution_chain is None:
+            try:
+                return await self._fetch_shared("evolution_chain", key, chain_url, self.evolution_cache,
+                                                lambda payload: self._store_evolution_chain(key, payload))
+            except UPSTREAM_ERRORS:
+                evolution_chain = await self._stale_fallback("evolution_chain", key, self.evolution_cache)
+                if evolution_chain is None:
+                    raise
+                return evolution_chain
+        self.evolution_cache[key] = evolution_chain
+        return evolution_chain
+
+    async def _store_evolution_chain(self, key: str, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        evolution_chain = self._process_evolution_chain(payload["chain"])
+        self._cache_set("evolution_chain", self.evolution_cache, key, evolution_chain)
+        if self.disk_cache is not None:
+            await self.disk_cache.put("evolution_chain", key, evolution_chain)
+        return evolution_chain
+
+    def _process_pokemon_data(
+        self,
+        pokemon_data: Dict,
+        species_data: Dict,
+        evolution_chain: List[Dict[str, Any]],
+        moves: List[Move],
+        movepool: List[int],
     ) -> Dict[str, Any]:
         """Process API data into structured format"""
 
@@ -72,23 +838,6 @@ class PokemonDataResource:
                 }
             )
 
-        # Moves (limit to first 20 for simplicity)
-        moves = []
-        for move in pokemon_data["moves"][:20]:
-            move_name = move["move"]["name"]
-            move_details = await self._get_move_details(move["move"]["url"])
-            moves.append(
-                {
-                    "name": move_name,
-                    "details": move_details,
-                }
-            )
-
-        # Evolution chain
-        evolution_chain = []
-        if evolution_data:
-            evolution_chain = self._process_evolution_chain(evolution_data["chain"])
-
         return {
             "id": pokemon_data["id"],
             "name": pokemon_data["name"],
@@ -97,7 +846,9 @@ class PokemonDataResource:
             "base_stats": base_stats,
             "types": types,
             "abilities": abilities,
-            "moves": moves,
+            # Move ids into move_table: the resolved moves, then the full learnset
+            "moves": [move.id for move in moves],
+            "movepool": movepool,
             "evolution_chain": evolution_chain,
             "sprites": {
                 "front_default": pokemon_data["sprites"]["front_default"],
@@ -105,46 +856,134 @@ class PokemonDataResource:
                 "front_shiny": pokemon_data["sprites"]["front_shiny"],
             },
             "base_experience": pokemon_data["base_experience"],
-            "generation": species_data.get("generation", {}).get("name", "unknown"),
+            "generation": (species_data.get("generation") or {}).get("name", "unknown"),
+        }
+
+    def _movepool(self, pokemon_data: Dict[str, Any]) -> List[int]:
+        """Ids of every move the Pokémon learns, in payload order, registered in move_table"""
+        movepool = []
+        for move in pokemon_data["moves"]:
+            _, ident, _ = parse_resource_url(move["move"]["url"])
+            movepool.append(self.move_table.ref(int(ident), move["move"]["name"]).id)
+        return movepool
+
+    async def get_move_details(self, move_id: int) -> Dict[str, Any]:
+        """Resolve one move id from a movepool to its details"""
+        with self._pin():
+            return (await self._get_move(move_id)).details()
+
+    async def _get_move(self, move_id: int) -> Move:
+        """The interned move for an id, with its details resolved"""
+        if self.move_dex is not None and move_id in self.move_dex and self._is_live():
+            return self.move_table[move_id]
+        details = await self._get_move_details(f"{self.base_url}/move/{move_id}/")
+        if self._diverged("move", f"move/{move_id}"):
+            # Another snapshot's details: a private copy, so the shared table is untouched
+            move = Move(move_id, self.move_table.ref(move_id, str(move_id)).name)
+            move.update(details)
+            return move
+        return self.move_table.store(move_id, details)
+
+    async def get_move_page(self, pokemon_name: str, cursor: Optional[str] = None,
+                            limit: int = 20) -> Dict[str, Any]:
+        """One page of a Pokémon's full movepool, resolving details for that page only"""
+        pokemon_name = normalize_name(pokemon_name)
+        start = 0
+        if cursor:
+            offset = decode_cursor(cursor)
+            if not offset.isdigit():
+                raise ValueError(f"Invalid cursor: {cursor}")
+            start = int(offset)
+        with self._pin():
+            return await self._move_page(pokemon_name, start, limit)
+
+    async def _move_page(self, pokemon_name: str, start: int, limit: int) -> Dict[str, Any]:
+        record = None if self._diverged("pokemon", pokemon_name) else self.cache.get(pokemon_name)
+        if record is not None and "movepool" in record:
+            movepool = record["movepool"]
+        else:
+            await self._validate_name(pokemon_name)
+            try:
+                movepool = self._movepool(await self._get_pokemon_payload(pokemon_name))
+            except NotFoundError:
+                self._cache_set("negative", self.negative_cache, pokemon_name, True)
+                raise ValueError(f"Pokémon '{pokemon_name}' not found")
+            except UPSTREAM_ERRORS as e:
+                raise ValueError(f"Error fetching Pokémon data: {e}")
+
+        page = movepool[start:start + max(0, limit)]
+        moves = await asyncio.gather(*(self._get_move(move_id) for move_id in page))
+        end = start + len(page)
+        return {
+            "pokemon": pokemon_name,
+            "count": len(movepool),
+            "moves": [{"name": move.name, "id": move.id, "details": move.details()} for move in moves],
+            "next_cursor": encode_cursor(str(end)) if end < len(movepool) else None,
         }
 
     async def _get_move_details(self, move_url: str) -> Dict[str, Any]:
         """Get detailed move information"""
-        if move_url in self.move_cache:
-            return self.move_cache[move_url]
+        key = resource_key(move_url)
+        cached = self._serve(self.move_cache, key, "move", move_url,
+                             lambda payload: self._store_move_details(key, payload))
+        if cached is not None:
+            return self._move_details_of(cached)
+
+        return await self._flight(("move", key), lambda: self._load_move_details(key, move_url))
+
+    async def _load_move_details(self, key: str, move_url: str) -> Dict[str, Any]:
+        """Fetch and process a move that is not cached yet"""
+        if self.disk_cache is not None:
+            stored = await self.disk_cache.get("move", key)
+            if stored is not None:
+                return self._cache_move(key, stored)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(move_url)
-                response.raise_for_status()
-                move_data = response.json()
-
-                details = {
-                    "type": move_data.get("type", {}).get("name", "normal"),
-                    "category": move_data.get("damage_class", {}).get("name", "physical"),
-                    "power": move_data.get("power"),
-                    "accuracy": move_data.get("accuracy"),
-                    "pp": move_data.get("pp", 0),
-                    "priority": move_data.get("priority", 0),
-                    "effect_chance": move_data.get("effect_chance"),
-                    "effect_entries": [
-                        entry["effect"]
-                        for entry in move_data.get("effect_entries", [])
-                        if entry["language"]["name"] == "en"
-                    ][:1],
-                }
+            return await self._fetch_shared("move", key, move_url, self.move_cache,
+                                            lambda payload: self._store_move_details(key, payload))
+        except UPSTREAM_ERRORS as e:
+            stale = await self._stale_fallback("move", key, self.move_cache)
+            if stale is not None:
+                return stale
+            return self._placeholder_move(move_url, e)
+        except Exception as e:
+            return self._placeholder_move(move_url, e)
 
-                self.move_cache[move_url] = details
-                return details
-        except Exception:
-            return {
-                "type": "normal",
-                "category": "physical",
-                "power": 40,
-                "accuracy": 100,
-                "pp": 35,
-                "priority": 0,
-            }
+    def _cache_move(self, key: str, details: Dict[str, Any], name: Optional[str] = None,
+                    ttl: Optional[float] = None) -> Dict[str, Any]:
+        """Keep a move's details in move_table; move_cache holds only its id, for TTL and revalidation"""
+        if self._diverged("move", key):
+            # Another snapshot's details are staged on it; the shared table is untouched
+            self._cache_set("move", self.move_cache, key, details, ttl)
+        else:
+            move = self.move_table.store(int(key.split("/")[1]), details, name)
+            self.move_cache.set(key, move.id, ttl=ttl)
+        return details
+
+    def _move_details_of(self, value: Any) -> Dict[str, Any]:
+        """Details for a move_cache value: an id into move_table, or a dict staged on another snapshot"""
+        return value if isinstance(value, dict) else self.move_table[value].details()
+
+    def _placeholder_move(self, move_url: str, error: Exception) -> Dict[str, Any]:
+        """Stand-in move when details cannot be loaded; flagged and never cached"""
+        logger.warning(f"Move fetch failed for {move_url}, using a placeholder: {error}")
+        self.degraded_stats["placeholder_moves"] += 1
+        return {
+            "type": "normal",
+            "category": "physical",
+            "power": 40,
+            "accuracy": 100,
+            "pp": 35,
+            "priority": 0,
+            "placeholder": True,
+        }
+
+    async def _store_move_details(self, key: str, move_data: Dict[str, Any]) -> Dict[str, Any]:
+        # A background refresh lands here too; records see the new details at once
+        details = self._cache_move(key, move_details(move_data), move_data.get("name"))
+        if self.disk_cache is not None:
+            await self.disk_cache.put("move", key, details)
+        return details
 
     def _process_evolution_chain(self, chain_data: Dict) -> List[Dict[str, Any]]:
         """Process evolution chain data recursively"""
@@ -176,33 +1015,15 @@ class PokemonDataResource:
         process_chain(chain_data)
         return evolution_chain
 
-    async def list_all_pokemon(self) -> Dict[str, Any]:
-        """List of all available Pokémon"""
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.base_url}/pokemon?limit=1010")
-                response.raise_for_status()
-                data = response.json()
-
-                return {
-                    "count": data["count"],
-                    "pokemon": [pokemon["name"] for pokemon in data["results"]],
-                }
-        except Exception as e:
-            raise ValueError(f"Error fetching Pokémon list: {e}")
+    async def list_all_pokemon(
+        self, prefix: str = "", cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """List available Pokémon from the cached catalog, optionally by prefix and page"""
+        catalog = await self.get_catalog()
+        if catalog is None:
+            raise ValueError("Error fetching Pokémon list: catalog unavailable")
+        return catalog.search(prefix, cursor, len(catalog) if limit is None else limit)
 
     async def get_type_effectiveness(self, attacking_type: str) -> Dict[str, List[str]]:
-        """Get effectiveness data for a type"""
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.base_url}/type/{attacking_type}")
-                response.raise_for_status()
-                type_data = response.json()
-
-                return {
-                    "double_damage_to": [t["name"] for t in type_data["damage_relations"]["double_damage_to"]],
-                    "half_damage_to": [t["name"] for t in type_data["damage_relations"]["half_damage_to"]],
-                    "no_damage_to": [t["name"] for t in type_data["damage_relations"]["no_damage_to"]],
-                }
-        except Exception as e:
-            raise ValueError(f"Error fetching type effectiveness: {e}")
+        """Get effectiveness data for a type, served from the compiled type chart"""
+        return self.type_chart.get_type_relations(attacking_type)
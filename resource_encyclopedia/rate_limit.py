@@ -0,0 +1,166 @@
+"""
+Outbound Rate Limiting
+Async token bucket for PokéAPI requests, with a priority lane and optional
+host-wide coordination through a shared, file-locked bucket
+"""
+import asyncio
+import logging
+import os
+import struct
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 0
+BACKGROUND = 1
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+# Priority of upstream calls made from the current task
+request_priority: ContextVar[int] = ContextVar("request_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def background_priority():
+    """Mark upstream calls in this block (and tasks it creates) as background traffic"""
+    token = request_priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class TokenBucket:
+    """Per-process bucket: `rate` tokens per second, up to `burst` banked.
+
+    Background callers only take a token when no interactive caller is
+    waiting, so user reads jump ahead of warm-up and refresh traffic.
+    """
+
+    # Longest single sleep while waiting, so a newly queued interactive caller is noticed
+    MAX_WAIT = 0.05
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst if burst else max(1.0, rate)
+        self.clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._waiting = {INTERACTIVE: 0, BACKGROUND: 0}
+        self.granted = {INTERACTIVE: 0, BACKGROUND: 0}
+        self.waited_seconds = 0.0
+
+    def _try_take(self) -> float:
+        """Take a token and return 0, or return seconds until one is available"""
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self, priority: Optional[int] = None) -> None:
+        priority = request_priority.get() if priority is None else priority
+        started = time.monotonic()
+        self._waiting[priority] += 1
+        try:
+            while True:
+                if priority == BACKGROUND and self._waiting[INTERACTIVE]:
+                    await asyncio.sleep(self.MAX_WAIT)
+                    continue
+                wait = self._try_take()
+                if not wait:
+                    break
+                await asyncio.sleep(min(wait, self.MAX_WAIT))
+        finally:
+            self._waiting[priority] -= 1
+        self.granted[priority] += 1
+        self.waited_seconds += time.monotonic() - started
+
+    def close(self) -> None:
+        """Release anything the bucket holds open; nothing for an in-process bucket"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "shared": False,
+            "granted": {PRIORITY_NAMES[p]: n for p, n in self.granted.items()},
+            "waiting": {PRIORITY_NAMES[p]: n for p, n in self._waiting.items()},
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional["TokenBucket"]:
+        """Build from POKEAPI_RATE_LIMIT (0 disables), POKEAPI_RATE_BURST and POKEAPI_RATE_LIMIT_FILE"""
+        rate = float(os.environ.get("POKEAPI_RATE_LIMIT", "20"))
+        if rate <= 0:
+            return None
+        burst = float(os.environ.get("POKEAPI_RATE_BURST", "0")) or None
+        path = os.environ.get("POKEAPI_RATE_LIMIT_FILE")
+        if path:
+            if fcntl is not None:
+                return SharedTokenBucket(path, rate, burst)
+            logger.warning("fcntl is unavailable; POKEAPI_RATE_LIMIT applies per worker")
+        return cls(rate, burst)
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket whose state lives in a small file, so every worker on the
+    host draws from the same budget. Each take holds an exclusive flock for
+    a read-modify-write of two doubles, which keeps the critical section to
+    a few microseconds. The lock is never waited for on the event loop: when
+    another worker holds it, the take is retried after LOCK_RETRY seconds.
+    """
+
+    _STATE = struct.Struct("<dd")  # tokens, updated (wall clock)
+    LOCK_RETRY = 0.001
+
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None):
+        super().__init__(rate, burst, clock=time.time)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.lock_retries = 0
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _try_take(self) -> float:
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self.lock_retries += 1
+            return self.LOCK_RETRY
+        try:
+            raw = os.pread(self._fd, self._STATE.size, 0)
+            now = self.clock()
+            if len(raw) == self._STATE.size:
+                tokens, updated = self._STATE.unpack(raw)
+                tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+            else:
+                tokens = self.burst
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+            os.pwrite(self._fd, self._STATE.pack(tokens, now), 0)
+            return wait
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "shared": True, "path": self.path, "lock_retries": self.lock_retries}
@@ -0,0 +1,226 @@
+"""
+Upstream Resilience
+Jittered retries, p95 request hedging and a circuit breaker for PokéAPI calls
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from resource_encyclopedia.errors import UpstreamUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth another attempt; everything else is the caller's answer
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe after reset_timeout"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probing = False
+        self._probe_started_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a request may go out now; half-open lets a single probe through"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self.state == self.HALF_OPEN:
+            # A probe that never reported back (e.g. cancelled) must not wedge the breaker
+            if not self._probing or self.clock() - self._probe_started_at >= self.reset_timeout:
+                self._probing = True
+                self._probe_started_at = self.clock()
+                return True
+        return False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info("PokéAPI circuit closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                logger.warning(f"PokéAPI circuit opened after {self.failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = self.clock()
+            self._probing = False
+
+
+class LatencyTracker:
+    """Sliding window of recent response times"""
+
+    def __init__(self, window: int = 200):
+        self.samples = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ResiliencePolicy:
+    """Wraps one upstream call with retries, hedging and the circuit breaker"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        hedge: bool = True,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_min_delay: float = 0.05,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyTracker()
+        self.counters = {
+            "calls": 0,
+            "retries": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "failures": 0,
+            "short_circuited": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "ResiliencePolicy":
+        """Build from POKEAPI_RETRY_* / POKEAPI_HEDGE* / POKEAPI_BREAKER_* variables"""
+        return cls(
+            max_attempts=int(os.environ.get("POKEAPI_RETRY_ATTEMPTS", "3")),
+            base_delay=float(os.environ.get("POKEAPI_RETRY_BASE_DELAY", "0.1")),
+            max_delay=float(os.environ.get("POKEAPI_RETRY_MAX_DELAY", "2")),
+            hedge=os.environ.get("POKEAPI_HEDGE", "1").lower() not in ("0", "false", "no"),
+            hedge_min_delay=float(os.environ.get("POKEAPI_HEDGE_MIN_DELAY", "0.05")),
+            breaker=CircuitBreaker(
+                failure_threshold=int(os.environ.get("POKEAPI_BREAKER_THRESHOLD", "5")),
+                reset_timeout=float(os.environ.get("POKEAPI_BREAKER_RESET", "30")),
+            ),
+        )
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """Full-jitter exponential delay, honouring a numeric Retry-After"""
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(self.max_delay, float(retry_after))
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def hedge_delay(self) -> Optional[float]:
+        if not self.hedge or len(self.latency) < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay, self.latency.quantile(self.hedge_quantile))
+
+    async def call(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Run send() until it yields a non-retryable response or attempts run out.
+
+        Raises UpstreamUnavailableError without calling send() while the
+        circuit is open.
+        """
+        if not self.breaker.allow():
+            self.counters["short_circuited"] += 1
+            raise UpstreamUnavailableError("PokéAPI circuit is open")
+        self.counters["calls"] += 1
+        response: Optional[httpx.Response] = None
+        error: Optional[Exception] = None
+        for attempt in range(self.max_attempts):
+            if attempt:
+                self.counters["retries"] += 1
+                await asyncio.sleep(self._backoff(attempt - 1, response))
+            try:
+                response, error = await self._hedged(send), None
+            except httpx.TransportError as e:
+                response, error = None, e
+                continue
+            if response.status_code not in RETRYABLE_STATUSES:
+                self.breaker.record_success()
+                return response
+        self.counters["failures"] += 1
+        self.breaker.record_failure()
+        if error is not None:
+            raise error
+        return response
+
+    async def _timed(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        started = time.monotonic()
+        response = await send()
+        self.latency.record(time.monotonic() - started)
+        return response
+
+    async def _hedged(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send once; if no answer by the recent p95, race a duplicate request"""
+        delay = self.hedge_delay()
+        primary = asyncio.ensure_future(self._timed(send))
+        tasks = [primary]
+        try:
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            self.counters["hedged"] += 1
+            hedge = asyncio.ensure_future(self._timed(send))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.counters["hedge_wins"] += 1
+                        return task.result()
+            # Both attempts failed; surface the primary's error
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        p95 = self.latency.quantile(0.95)
+        return {
+            **self.counters,
+            "circuit": self.breaker.state,
+            "circuit_opened": self.breaker.times_opened,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+        }
@@ -0,0 +1,139 @@
+"""
+Selective JSON Parsing
+Stream a JSON body and build only the fields a consumer reads
+
+With ijson installed the body is parsed incrementally and skipped subtrees
+(e.g. moves[].version_group_details) are never turned into Python objects.
+Without it the body is decoded with json and then projected, which gives
+the same result without the memory savings.
+"""
+import io
+import json
+from typing import Any, AsyncIterator, Iterable, List, Tuple
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# False when bodies are buffered and decoded whole because ijson is not installed
+STREAMING = ijson is not None
+
+_CONTAINERS = {"start_map": dict, "start_array": list}
+
+
+def _parents(field: str) -> List[str]:
+    parts = field.split(".")
+    return [".".join(parts[:i]) for i in range(1, len(parts))]
+
+
+class Projection:
+    """A set of dotted field paths to keep.
+
+    List items share their list's path, so "moves.move" keeps the "move" key
+    of every element of "moves". Naming a container keeps all of it.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self.keep = frozenset(fields)
+        self.parents = frozenset(parent for field in self.keep for parent in _parents(field))
+
+    def _child(self, path: str, key: str) -> str:
+        return f"{path}.{key}" if path else key
+
+    def apply(self, value: Any, path: str = "") -> Any:
+        """Project an already decoded value"""
+        if isinstance(value, dict):
+            projected = {}
+            for key, item in value.items():
+                child = self._child(path, key)
+                if child in self.keep:
+                    projected[key] = item
+                elif child in self.parents:
+                    projected[key] = self.apply(item, child)
+            return projected
+        if isinstance(value, list):
+            return [self.apply(item, path) for item in value]
+        return value
+
+    async def parse(self, chunks: AsyncIterator[bytes]) -> Any:
+        """Parse a streamed body into the projected value"""
+        if ijson is None:
+            return self.apply(json.loads(b"".join([chunk async for chunk in chunks])))
+        builder = _Builder(self)
+        # Push-style parsing: events come back in one batch per chunk, which
+        # is much cheaper than awaiting ijson's async iterator per event
+        events = ijson.sendable_list()
+        parser = ijson.basic_parse_coro(events, use_float=True)
+        async for chunk in chunks:
+            if chunk:
+                parser.send(chunk)
+                builder.feed(events)
+                del events[:]
+        parser.close()
+        builder.feed(events)
+        return builder.root
+
+    def parse_bytes(self, body: bytes) -> Any:
+        """Parse an in-memory body into the projected value"""
+        if ijson is None:
+            return self.apply(json.loads(body))
+        builder = _Builder(self)
+        builder.feed(ijson.basic_parse(io.BytesIO(body), use_float=True))
+        return builder.root
+
+
+class _Builder:
+    """Builds a projected value from ijson basic_parse events"""
+
+    def __init__(self, projection: Projection):
+        self.keep = projection.keep
+        self.parents = projection.parents
+        self.root: Any = None
+        # Open containers: [container, path, pending map key, inside a kept subtree]
+        self._stack: List[list] = []
+        self._skip = 0
+
+    def feed(self, events: Iterable[Tuple[str, Any]]) -> None:
+        keep, parents, stack = self.keep, self.parents, self._stack
+        for event, value in events:
+            if self._skip:
+                # Inside a dropped subtree: only track nesting
+                if event == "start_map" or event == "start_array":
+                    self._skip += 1
+                elif event == "end_map" or event == "end_array":
+                    self._skip -= 1
+                continue
+            if event == "map_key":
+                stack[-1][2] = value
+                continue
+            if event == "end_map" or event == "end_array":
+                stack.pop()
+                continue
+
+            path, whole, parent = "", False, None
+            if stack:
+                parent, parent_path, key, whole = stack[-1]
+                if isinstance(parent, list):
+                    path = parent_path
+                else:
+                    path = f"{parent_path}.{key}" if parent_path else key
+                if not whole:
+                    if path in keep:
+                        whole = True
+                    elif path not in parents:
+                        if event in _CONTAINERS:
+                            self._skip = 1
+                        continue
+
+            container = _CONTAINERS[event]() if event in _CONTAINERS else None
+            if container is not None:
+                value = container
+            if parent is None:
+                self.root = value
+            elif isinstance(parent, list):
+                parent.append(value)
+            else:
+                parent[stack[-1][2]] = value
+            if container is not None:
+                stack.append([container, path, None, whole])
@@ -0,0 +1,117 @@
+"""
+Data Service
+The process-wide PokemonDataResource and everything behind it, built once and
+handed to every consumer (MCP dispatcher, REST routes, battle tool)
+"""
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from resource_encyclopedia import selective_json
+from resource_encyclopedia.cache import BoundedCache
+from resource_encyclopedia.dataset import LocalDataset
+from resource_encyclopedia.disk_cache import DiskCache
+from resource_encyclopedia.http_client import UpstreamClient
+from resource_encyclopedia.move_dex import MoveDex
+from resource_encyclopedia.poke_data import PokemonDataResource
+from resource_encyclopedia.species_table import SpeciesTable
+from resource_encyclopedia.warmup import AccessLog
+
+logger = logging.getLogger(__name__)
+
+
+class DataService:
+    """One connection pool, one cache hierarchy and one resource per process"""
+
+    def __init__(self, resource: PokemonDataResource, purge_interval: float = 300.0):
+        self.resource = resource
+        # Expired entries are otherwise only dropped when touched or evicted (0 = never purge)
+        self.purge_interval = purge_interval
+        self._purge_task: Optional[asyncio.Task] = None
+
+    @property
+    def http_client(self) -> UpstreamClient:
+        return self.resource.http_client
+
+    @property
+    def disk_cache(self) -> Optional[DiskCache]:
+        return self.resource.disk_cache
+
+    @property
+    def access_log(self) -> Optional[AccessLog]:
+        return self.resource.access_log
+
+    @classmethod
+    def from_env(cls) -> "DataService":
+        """Build the resource and its pool, caches and stores from environment variables"""
+        # POKEMON_DATA_MODE=offline serves everything from a dataset built with
+        # `python -m resource_encyclopedia.dataset build`
+        offline_mode = os.environ.get("POKEMON_DATA_MODE", "online").lower() == "offline"
+        dataset_dir = os.environ.get("POKEMON_DATASET_DIR", "dataset")
+        dataset = LocalDataset.load(dataset_dir) if offline_mode else None
+        # The mmap'd species table is shared read-only by every worker on the host
+        species_table_path = os.environ.get("POKEMON_SPECIES_TABLE", os.path.join(dataset_dir, "species.bin"))
+        species_table = SpeciesTable(species_table_path) if os.path.exists(species_table_path) else None
+        # Online, the dataset's move table (if built) still spares one request per move;
+        # offline the resource builds the dex from the dataset itself
+        move_dex = None
+        if dataset is None and os.path.exists(os.path.join(dataset_dir, "move.json.gz")):
+            move_dex = MoveDex.load(dataset_dir)
+        resource = PokemonDataResource(
+            http_client=UpstreamClient.from_env(),
+            max_concurrent_fetches=int(os.environ.get("POKEAPI_MAX_CONCURRENT_FETCHES", "10")),
+            cache=BoundedCache.from_env("POKEMON_CACHE", max_entries=1500, ttl=24 * 3600, policy="tinylfu",
+                                        stale_ttl=24 * 3600, hot_entries=200),
+            move_cache=BoundedCache.from_env("MOVE_CACHE", max_entries=2000, ttl=24 * 3600, stale_ttl=24 * 3600),
+            species_cache=BoundedCache.from_env("SPECIES_CACHE", max_entries=1200, ttl=24 * 3600,
+                                                stale_ttl=24 * 3600),
+            evolution_cache=BoundedCache.from_env("EVOLUTION_CACHE", max_entries=600, ttl=24 * 3600,
+                                                  stale_ttl=24 * 3600),
+            negative_cache=BoundedCache.from_env("NEGATIVE_CACHE", max_entries=5000, ttl=300),
+            payload_cache=BoundedCache.from_env("PAYLOAD_CACHE", max_entries=1500, ttl=24 * 3600, hot_entries=100),
+            disk_cache=None if offline_mode else DiskCache.from_env(),
+            dataset=dataset,
+            species_table=species_table,
+            move_dex=move_dex,
+            access_log=AccessLog.from_env(),
+        )
+        return cls(resource, purge_interval=float(os.environ.get("CACHE_PURGE_INTERVAL", "300")))
+
+    async def start(self) -> None:
+        """Open the shared connection pool and stores"""
+        if not selective_json.STREAMING:
+            logger.warning("ijson is not installed: upstream bodies are buffered and decoded whole, "
+                           "not streamed (pip install ijson)")
+        await self.http_client.start()
+        if self.disk_cache is not None:
+            await self.disk_cache.open()
+        if self.access_log is not None:
+            self.access_log.load()
+        if self.purge_interval > 0 and self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._purge_expired())
+
+    async def _purge_expired(self) -> None:
+        while True:
+            await asyncio.sleep(self.purge_interval)
+            purged = self.resource.purge_expired()
+            if any(purged.values()):
+                logger.info(f"Purged expired cache entries: {purged}")
+
+    async def close(self) -> None:
+        """Stop the purge task, persist access counts and close the pool and stores"""
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+        if self.access_log is not None:
+            self.access_log.save()
+        await self.http_client.close()
+        if self.http_client.rate_limiter is not None:
+            # A shared bucket holds its lock file open
+            self.http_client.rate_limiter.close()
+        if self.disk_cache is not None:
+            await self.disk_cache.close()
@@ -0,0 +1,48 @@
+"""
+Single-Flight Request Collapsing
+Concurrent misses on the same key share one in-flight upstream call
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Deduplicate concurrent async calls by key"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn once per key; concurrent callers await the same result.
+
+        Results and errors are delivered to every waiter but never kept:
+        the key is released as soon as the call settles.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.shared += 1
+        # Shield so one cancelled waiter does not cancel the call for the others
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            future.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._inflight)}
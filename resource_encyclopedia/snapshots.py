@@ -0,0 +1,192 @@
+"""
+Dataset Snapshots
+Versioned offline datasets, loaded in the background and swapped into a
+running PokemonDataResource without a restart
+
+Build each version into its own directory and point POKEMON_DATASET_DIR at
+a symlink to the live one; flipping the symlink is picked up by the watcher.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
+
+from resource_encyclopedia.dataset import MANIFEST, SPECIES_TABLE, LocalDataset, resource_key
+from resource_encyclopedia.species_table import SpeciesTable
+
+logger = logging.getLogger(__name__)
+
+# (cache namespace, cache key), as used by PokemonDataResource
+Change = Tuple[str, str]
+
+
+class DatasetSnapshot:
+    """One dataset version and its species table.
+
+    `changes` lists the cache entries that differ from the snapshot named by
+    `parent`; both are filled in when the snapshot is swapped in.
+    """
+
+    def __init__(self, dataset: LocalDataset, species_table: Optional[SpeciesTable] = None):
+        self.dataset = dataset
+        self.species_table = species_table
+        # Query indexes over species_table: patched from the previous snapshot's on a swap, else built on first use
+        self.species_index = None
+        self.parent: Optional[str] = None
+        self.changes: FrozenSet[Change] = frozenset()
+        # Values built on this snapshot while it was not live, keyed like `changes`
+        self.staged: Dict[Change, Tuple[Any, Optional[float]]] = {}
+        # Calls reading this snapshot right now; once it is retired the last one closes it
+        self.pins = 0
+        self.retired = False
+
+    @property
+    def version(self) -> str:
+        return self.dataset.version
+
+    def pin(self) -> None:
+        self.pins += 1
+
+    def unpin(self) -> None:
+        self.pins -= 1
+        if self.retired and self.pins == 0:
+            self.close()
+
+    def retire(self) -> None:
+        """Mark a swapped-out snapshot; it is closed as soon as no call reads it"""
+        self.retired = True
+        if self.pins == 0:
+            self.close()
+
+    def close(self) -> None:
+        """Unmap the species table"""
+        self.species_index = None
+        if self.species_table is not None:
+            self.species_table.close()
+            self.species_table = None
+
+    @classmethod
+    def load(cls, directory: str) -> "DatasetSnapshot":
+        """Load a dataset directory; this blocks, so run it off the event loop"""
+        # A symlinked directory resolves to the version it points at right now
+        directory = os.path.realpath(directory)
+        dataset = LocalDataset.load(directory)
+        table_path = os.path.join(directory, SPECIES_TABLE)
+        return cls(dataset, SpeciesTable(table_path) if os.path.exists(table_path) else None)
+
+
+def _changed_ids(old: LocalDataset, new: LocalDataset, kind: str) -> Set[str]:
+    old_entries = old.tables[kind].entries if kind in old.tables else {}
+    new_entries = new.tables[kind].entries if kind in new.tables else {}
+    return {ident for ident in old_entries.keys() | new_entries.keys() if old_entries.get(ident) != new_entries.get(ident)}
+
+
+def diff_datasets(old: LocalDataset, new: LocalDataset) -> FrozenSet[Change]:
+    """Cache entries whose source data differs between two datasets"""
+    changed = {kind: _changed_ids(old, new, kind) for kind in ("pokemon", "pokemon-species", "evolution-chain", "move")}
+    changes: Set[Change] = set()
+    changes.update(("species", f"pokemon-species/{ident}") for ident in changed["pokemon-species"])
+    changes.update(("evolution_chain", f"evolution-chain/{ident}") for ident in changed["evolution-chain"])
+    changes.update(("move", f"move/{ident}") for ident in changed["move"])
+
+    # Records embed their species' generation and evolution chain; moves are
+    # interned by id, so a changed move never invalidates a record
+    for dataset in (old, new):
+        if "pokemon" not in dataset.tables:
+            continue
+        species = dataset.tables.get("pokemon-species")
+        for ident, entry in dataset.tables["pokemon"].entries.items():
+            species_key = resource_key(entry["species"]["url"])
+            species_entry = species.get(species_key.split("/")[1]) if species is not None else None
+            chain = (species_entry or {}).get("evolution_chain")
+            payload_changed = ident in changed["pokemon"]
+            if (payload_changed or ("species", species_key) in changes
+                    or (chain and ("evolution_chain", resource_key(chain["url"])) in changes)):
+                # Records and payloads are keyed by whatever the caller asked for
+                for key in (entry["name"], ident):
+                    changes.add(("pokemon", key))
+                    if payload_changed:
+                        changes.add(("pokemon_payload", key))
+    return frozenset(changes)
+
+
+class SnapshotWatcher:
+    """Polls a dataset directory and swaps each new manifest version into the resource"""
+
+    def __init__(self, resource, directory: str, interval: float = 60.0):
+        self.resource = resource
+        self.directory = directory
+        self.interval = interval
+        self.swaps = 0
+        self.last_swap_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, resource) -> "SnapshotWatcher":
+        """Watch POKEMON_DATASET_DIR every POKEMON_DATASET_POLL seconds (0 = only on request)"""
+        return cls(
+            resource,
+            os.environ.get("POKEMON_DATASET_DIR", "dataset"),
+            interval=float(os.environ.get("POKEMON_DATASET_POLL", "60")),
+        )
+
+    def _disk_version(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.directory, MANIFEST), encoding="utf-8") as f:
+                return json.load(f).get("version")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot read dataset manifest in {self.directory}: {e}")
+            return None
+
+    async def check(self) -> bool:
+        """Swap in the dataset on disk if its version differs from the live one"""
+        async with self._lock:
+            version = await asyncio.to_thread(self._disk_version)
+            if version is None or version == self.resource.dataset_version:
+                return False
+            snapshot = None
+            try:
+                snapshot = await asyncio.to_thread(DatasetSnapshot.load, self.directory)
+                await self.resource.swap_snapshot(snapshot)
+            except Exception as e:
+                # swap_snapshot fails before installing, so the snapshot was never live
+                if snapshot is not None:
+                    snapshot.close()
+                self.last_error = str(e)
+                logger.warning(f"Dataset swap to {version} failed, still serving {self.resource.dataset_version}: {e}")
+                return False
+            self.swaps += 1
+            self.last_swap_at = time.time()
+            self.last_error = None
+            return True
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "version": self.resource.dataset_version,
+            "directory": self.directory,
+            "poll_seconds": self.interval,
+            "swaps": self.swaps,
+            "last_swap_at": self.last_swap_at,
+            "last_error": self.last_error,
+        }
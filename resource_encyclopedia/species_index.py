@@ -0,0 +1,149 @@
+"""
+Species Index
+Secondary indexes over the species table for multi-criteria Pokémon queries
+
+Type and generation filters are row bitmaps, so "fire or dragon" is one OR
+and every extra filter one AND; stat ranges and ordering use per-field
+sorted columns (see bitmap_index). When a new dataset version keeps the same
+rows, the index is patched for the changed ones instead of rebuilt.
+"""
+import copy
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from resource_encyclopedia.bitmap_index import (
+    Range, SortedColumn, group_bitmaps, next_cursor, parse_page, parse_ranges, parse_sort, patch_bitmaps, select,
+    split_list,
+)
+from resource_encyclopedia.species_table import NONE_U16, STAT_NAMES, SpeciesTable
+from rule.chart import ALL_TYPES
+
+# Numeric fields that can be filtered on and sorted by
+FIELDS = ("id", *STAT_NAMES, "base_stat_total", "height", "weight", "base_experience")
+
+
+class SpeciesQuery(NamedTuple):
+    """Filters, ordering and page of one query"""
+    types: Tuple[str, ...] = ()
+    # "any": at least one of the types; "all": every one of them
+    type_match: str = "any"
+    generations: Tuple[int, ...] = ()
+    ranges: Tuple[Range, ...] = ()
+    sort: str = "id"
+    descending: bool = False
+    offset: int = 0
+    limit: int = 20
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any], default_limit: int = 20, max_limit: int = 100) -> "SpeciesQuery":
+        """Parse flat request parameters: types, type_match, generations,
+        min_<field>/max_<field>, sort (prefix '-' for descending), limit, cursor
+        """
+        type_match = str(params.get("type_match") or "any").lower()
+        if type_match not in ("any", "all"):
+            raise ValueError("type_match must be 'any' or 'all'")
+        try:
+            generations = tuple(int(g) for g in split_list(params.get("generations")))
+        except ValueError:
+            raise ValueError("generations must be integers")
+        sort, descending = parse_sort(params, FIELDS)
+        offset, limit = parse_page(params, default_limit, max_limit)
+        return cls(
+            types=tuple(split_list(params.get("types"))),
+            type_match=type_match,
+            generations=generations,
+            ranges=parse_ranges(params, FIELDS),
+            sort=sort,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+        )
+
+
+class SpeciesIndex:
+    """Type and generation bitmaps plus sorted field columns for one species table"""
+
+    def __init__(self, table: SpeciesTable):
+        self.table = table
+        self.size = len(table)
+        self.all = (1 << self.size) - 1
+        columns = table.columns
+
+        self.by_type: Dict[str, int] = {}
+        for column in ("type1", "type2"):
+            for type_id, bits in group_bitmaps([t or None for t in columns[column]], self.size).items():
+                name = table.type_name(type_id)
+                self.by_type[name] = self.by_type.get(name, 0) | bits
+        self.by_generation = group_bitmaps(list(columns["generation"]), self.size)
+
+        self.columns: Dict[str, SortedColumn] = {}
+        for field in FIELDS:
+            if field == "base_stat_total":
+                stats = [columns[stat] for stat in STAT_NAMES]
+                values = [sum(column[row] for column in stats) for row in range(self.size)]
+            else:
+                values = [None if value == NONE_U16 else value for value in columns[field]]
+            self.columns[field] = SortedColumn(values)
+
+    @staticmethod
+    def _value(table: SpeciesTable, field: str, row: int) -> Optional[int]:
+        if field == "base_stat_total":
+            return sum(table.columns[stat][row] for stat in STAT_NAMES)
+        value = table.columns[field][row]
+        return None if value == NONE_U16 else value
+
+    def patched(self, table: SpeciesTable, ids: Iterable[int]) -> Optional["SpeciesIndex"]:
+        """This index moved onto a newer table, re-reading only the rows of `ids`.
+
+        None when the new table's rows differ (species added, removed or
+        renumbered) and a full build is needed. This index is left as it is,
+        for requests still reading the old table.
+        """
+        old = self.table
+        if len(table) != self.size or table.columns["id"] != old.columns["id"]:
+            return None
+        rows = sorted({row for row in (table.find(str(ident)) for ident in ids) if row is not None})
+        index = copy.copy(self)
+        index.table = table
+        index.by_type = patch_bitmaps(self.by_type, [(row, old.types(row), table.types(row)) for row in rows])
+        index.by_generation = patch_bitmaps(self.by_generation, [
+            (row, [old.columns["generation"][row]], [table.columns["generation"][row]]) for row in rows
+        ])
+        index.columns = {
+            field: column.patched([(row, self._value(old, field, row), self._value(table, field, row)) for row in rows])
+            for field, column in self.columns.items()
+        }
+        return index
+
+    def _types(self, types: Tuple[str, ...], match_all: bool) -> int:
+        unknown = [name for name in types if name not in self.by_type and name not in ALL_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown type: {', '.join(unknown)}")
+        masks = [self.by_type.get(name, 0) for name in types]
+        bits = masks[0]
+        for mask in masks[1:]:
+            bits = bits & mask if match_all else bits | mask
+        return bits
+
+    def match(self, query: SpeciesQuery) -> int:
+        """Bitmap of the rows passing every filter"""
+        bits = self.all
+        if query.types:
+            bits &= self._types(query.types, query.type_match == "all")
+        if query.generations:
+            generations = 0
+            for gen in query.generations:
+                generations |= self.by_generation.get(gen, 0)
+            bits &= generations
+        for field, lo, hi in query.ranges:
+            bits &= self.columns[field].range(lo, hi)
+        return bits
+
+    def search(self, query: SpeciesQuery) -> Dict[str, Any]:
+        """One page of matching species records, in the requested order"""
+        order = self.columns[query.sort].order(query.descending)
+        total, rows = select(self.match(query), self.size, order, query.offset, query.limit)
+        return {
+            "count": total,
+            "pokemon": [self.table.record(row) for row in rows],
+            "next_cursor": next_cursor(query.offset, query.limit, total),
+        }
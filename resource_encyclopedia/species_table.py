@@ -0,0 +1,287 @@
+"""
+Species Table
+Memory-mapped columnar snapshot of per-Pokémon base data
+
+Layout (little-endian, every section 8-byte aligned):
+    header      magic "PKST", format u16, reserved u16, row count u32
+    columns     id i32, six base stats u16, type1/type2 u8 (0 = none),
+                generation u8, height u16, weight u16, base_experience u16
+    name_order  u32 row indexes sorted by name, for binary search
+    strings     Pokémon names, then type names (u32 count, u32 offsets, utf-8 blob)
+
+Opening a table maps the file read-only, so every worker process shares one
+page-cache copy and startup does no parsing at all.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"PKST"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")
+STAT_NAMES = ("hp", "attack", "defense", "special_attack", "special_defense", "speed")
+# (column, array typecode)
+COLUMNS = (
+    ("id", "i"),
+    *((stat, "H") for stat in STAT_NAMES),
+    ("type1", "B"),
+    ("type2", "B"),
+    ("generation", "B"),
+    ("height", "H"),
+    ("weight", "H"),
+    ("base_experience", "H"),
+)
+# Stored in u16 columns when a value is missing
+NONE_U16 = 0xFFFF
+_ROMAN = {"i": 1, "v": 5, "x": 10}
+
+
+def generation_number(name: Optional[str]) -> int:
+    """'generation-iv' -> 4; 0 when unknown"""
+    if not name or "-" not in name:
+        return 0
+    numeral = name.rsplit("-", 1)[1].lower()
+    total = 0
+    for i, char in enumerate(numeral):
+        value = _ROMAN.get(char, 0)
+        if i + 1 < len(numeral) and value < _ROMAN.get(numeral[i + 1], 0):
+            total -= value
+        else:
+            total += value
+    return total
+
+
+def _generation(value: Any) -> int:
+    """A row's generation as a number, given 4, "4" or "generation-iv" (as in resource records)"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return generation_number(value)
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _pack_strings(values: List[str]) -> bytes:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = array("I", [0])
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return struct.pack("<I", len(values)) + offsets.tobytes() + b"".join(encoded)
+
+
+def write_species_table(path: str, rows: Iterable[Dict[str, Any]]) -> int:
+    """Write rows (name, id, base_stats, types, generation, ...) to a table file;
+    PokemonDataResource records can be written as they are
+    """
+    rows = sorted(rows, key=lambda row: row["id"])
+    type_names: List[str] = []
+    type_ids: Dict[str, int] = {}
+
+    def type_id(name: Optional[str]) -> int:
+        if not name:
+            return 0
+        if name not in type_ids:
+            type_names.append(name)
+            type_ids[name] = len(type_names)
+        return type_ids[name]
+
+    columns = {name: array(code) for name, code in COLUMNS}
+    for row in rows:
+        types = list(row.get("types") or [])
+        columns["id"].append(row["id"])
+        for stat in STAT_NAMES:
+            columns[stat].append(min(int(row["base_stats"].get(stat, 0)), NONE_U16 - 1))
+        columns["type1"].append(type_id(types[0] if types else None))
+        columns["type2"].append(type_id(types[1] if len(types) > 1 else None))
+        columns["generation"].append(_generation(row.get("generation")))
+        for field in ("height", "weight", "base_experience"):
+            value = row.get(field)
+            columns[field].append(NONE_U16 if value is None else min(int(value), NONE_U16 - 1))
+
+    names = [row["name"] for row in rows]
+    name_order = array("I", sorted(range(len(rows)), key=lambda i: names[i]))
+
+    body = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(rows)))
+    for column in list(columns.values()) + [name_order]:
+        body.extend(b"\0" * (_align(len(body)) - len(body)))
+        if sys.byteorder != "little":
+            column.byteswap()
+        body.extend(column.tobytes())
+    for strings in (names, type_names):
+        body.extend(b"\0" * (_align(len(body)) - len(body)))
+        body.extend(_pack_strings(strings))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+def rows_from_dataset(dataset) -> List[Dict[str, Any]]:
+    """Flatten a LocalDataset's pokemon + species tables into table rows"""
+    pokemon_table = dataset.tables["pokemon"]
+    species_table = dataset.tables.get("pokemon-species")
+    rows = []
+    for entry in pokemon_table.entries.values():
+        generation = 0
+        if species_table is not None and entry.get("species"):
+            species = species_table.get(entry["species"]["name"])
+            if species and species.get("generation"):
+                generation = generation_number(species["generation"]["name"])
+        rows.append({
+            "id": entry["id"],
+            "name": entry["name"],
+            "base_stats": {s["stat"]["name"].replace("-", "_"): s["base_stat"] for s in entry["stats"]},
+            "types": [t["type"]["name"] for t in sorted(entry["types"], key=lambda t: t["slot"])],
+            "generation": generation,
+            "height": entry.get("height"),
+            "weight": entry.get("weight"),
+            "base_experience": entry.get("base_experience"),
+        })
+    return rows
+
+
+class SpeciesTable:
+    """Read-only, memory-mapped view over a species table file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, _, count = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a species table (format {FORMAT_VERSION})")
+        self.count = count
+
+        offset = _HEADER.size
+        self.columns: Dict[str, Any] = {}
+        for name, code in list(COLUMNS) + [("name_order", "I")]:
+            offset = _align(offset)
+            size = array(code).itemsize * count
+            self.columns[name] = self._column(view[offset:offset + size], code)
+            offset += size
+        self._names, offset = self._strings(view, _align(offset))
+        self._type_names, _ = self._strings(view, _align(offset))
+        self.name_order = self.columns.pop("name_order")
+
+    @staticmethod
+    def _column(raw: memoryview, code: str):
+        if sys.byteorder == "little":
+            return raw.cast(code)
+        # Big-endian hosts pay one copy instead of zero
+        column = array(code, raw.tobytes())
+        column.byteswap()
+        return column
+
+    def _strings(self, view: memoryview, offset: int) -> Tuple[Tuple[Any, memoryview], int]:
+        (count,) = struct.unpack_from("<I", view, offset)
+        offsets = self._column(view[offset + 4:offset + 4 + 4 * (count + 1)], "I")
+        blob_start = offset + 4 + 4 * (count + 1)
+        blob = view[blob_start:blob_start + offsets[count]]
+        return (offsets, blob), blob_start + offsets[count]
+
+    def close(self) -> None:
+        # Drop memoryviews before closing the map
+        self.columns = {}
+        self.name_order = None
+        self._names = self._type_names = None
+        if getattr(self, "_mmap", None) is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    @staticmethod
+    def _string_at(strings, i: int) -> str:
+        offsets, blob = strings
+        return bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def name(self, row: int) -> str:
+        return self._string_at(self._names, row)
+
+    def type_name(self, type_id: int) -> Optional[str]:
+        return self._string_at(self._type_names, type_id - 1) if type_id else None
+
+    def type_names(self) -> List[str]:
+        return [self._string_at(self._type_names, i) for i in range(len(self._type_names[0]) - 1)]
+
+    def find(self, ident: str) -> Optional[int]:
+        """Row index for a name or numeric id, by binary search"""
+        if ident.isdigit():
+            ids, target = self.columns["id"], int(ident)
+            lo, hi = 0, self.count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if ids[mid] < target:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo if lo < self.count and ids[lo] == target else None
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.name(self.name_order[mid]) < ident:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self.name(self.name_order[lo]) == ident:
+            return self.name_order[lo]
+        return None
+
+    def __contains__(self, ident: str) -> bool:
+        return self.find(ident) is not None
+
+    def base_stats(self, row: int) -> Dict[str, int]:
+        return {stat: self.columns[stat][row] for stat in STAT_NAMES}
+
+    def types(self, row: int) -> List[str]:
+        return [self.type_name(t) for t in (self.columns["type1"][row], self.columns["type2"][row]) if t]
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Materialize one row in PokemonDataResource record shape"""
+        optional = {}
+        for field in ("height", "weight", "base_experience"):
+            value = self.columns[field][row]
+            optional[field] = None if value == NONE_U16 else value
+        generation = self.columns["generation"][row]
+        return {
+            "id": self.columns["id"][row],
+            "name": self.name(row),
+            "base_stats": self.base_stats(row),
+            "types": self.types(row),
+            "generation": f"generation-{_to_roman(generation)}" if generation else "unknown",
+            **optional,
+        }
+
+    def get(self, ident: str) -> Optional[Dict[str, Any]]:
+        row = self.find(ident)
+        return self.record(row) if row is not None else None
+
+    def names(self) -> List[str]:
+        """All names in sorted order"""
+        return [self.name(row) for row in self.name_order]
+
+
+def _to_roman(number: int) -> str:
+    numerals = ((10, "x"), (9, "ix"), (5, "v"), (4, "iv"), (1, "i"))
+    result = ""
+    for value, numeral in numerals:
+        while number >= value:
+            result += numeral
+            number -= value
+    return result
@@ -0,0 +1,189 @@
+"""
+Cache Warm-up
+Access-frequency log and background prefetch of hot Pokémon after a deploy
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from resource_encyclopedia.rate_limit import background_priority
+
+logger = logging.getLogger(__name__)
+
+
+class AccessLog:
+    """Per-name request counts, persisted to a JSON file across restarts.
+
+    Counts are merged into whatever is on disk at save time, so several
+    workers sharing one file add up instead of overwriting each other.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.counts: Counter = Counter()
+        self._pending: Counter = Counter()
+
+    @classmethod
+    def from_env(cls) -> Optional["AccessLog"]:
+        """Build from POKEMON_ACCESS_LOG; an empty path disables it"""
+        path = os.environ.get("POKEMON_ACCESS_LOG", "cache/access_counts.json")
+        return cls(path) if path else None
+
+    def _read(self) -> Counter:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return Counter({name: int(count) for name, count in json.load(f).items()})
+        except FileNotFoundError:
+            return Counter()
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable access log {self.path}: {e}")
+            return Counter()
+
+    def load(self) -> None:
+        self.counts = self._read() + self._pending
+
+    def record(self, name: str) -> None:
+        self.counts[name] += 1
+        self._pending[name] += 1
+
+    def top(self, k: int) -> List[str]:
+        return [name for name, _ in self.counts.most_common(k)]
+
+    def save(self) -> None:
+        """Add counts recorded since the last save to the file, atomically"""
+        if not self._pending:
+            return
+        merged = self._read() + self._pending
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(dict(merged), f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save access log {self.path}: {e}")
+            return
+        self.counts = merged
+        self._pending = Counter()
+
+
+class CacheWarmer:
+    """Prefetch a list of Pokémon in the background with bounded parallelism.
+
+    `ready` flips once ready_fraction of the targets are cached, so a
+    readiness probe can hold traffic until the hot set is warm. It also flips
+    when the run finishes or `timeout` seconds pass, whatever was warmed:
+    with PokéAPI down, a worker can still serve from disk and stale entries.
+    """
+
+    def __init__(self, resource, names: List[str], concurrency: int = 4, ready_fraction: float = 0.8,
+                 timeout: float = 120.0):
+        self.resource = resource
+        self.names = list(dict.fromkeys(names))
+        self.concurrency = max(1, concurrency)
+        self.ready_fraction = min(max(ready_fraction, 0.0), 1.0)
+        # Seconds after start that the worker is ready regardless (0 = wait for the run)
+        self.timeout = timeout
+        self.warmed = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._next_report = 0.1
+
+    @classmethod
+    def from_env(cls, resource, access_log: Optional[AccessLog] = None) -> "CacheWarmer":
+        """Targets are POKEMON_WARMUP_SPECIES plus the top POKEMON_WARMUP_TOP_K logged names"""
+        if os.environ.get("POKEMON_WARMUP", "1").lower() in ("0", "false", "no"):
+            return cls(resource, [])
+        names = [n.strip().lower() for n in os.environ.get("POKEMON_WARMUP_SPECIES", "").split(",") if n.strip()]
+        top_k = int(os.environ.get("POKEMON_WARMUP_TOP_K", "50"))
+        if access_log is not None and top_k > 0:
+            names += access_log.top(top_k)
+        return cls(
+            resource,
+            names,
+            concurrency=int(os.environ.get("POKEMON_WARMUP_CONCURRENCY", "4")),
+            ready_fraction=float(os.environ.get("POKEMON_WARMUP_READY_FRACTION", "0.8")),
+            timeout=float(os.environ.get("POKEMON_WARMUP_TIMEOUT", "120")),
+        )
+
+    @property
+    def ready(self) -> bool:
+        if self.warmed >= self.ready_fraction * len(self.names) or self.finished_at is not None:
+            return True
+        return bool(self.timeout) and self.started_at is not None and time.monotonic() - self.started_at >= self.timeout
+
+    def start(self) -> None:
+        """Begin warming in a background task; returns immediately"""
+        if self._task is None and self.names:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self) -> None:
+        # Warm-up yields upstream capacity to user requests
+        with background_priority():
+            await self._run()
+
+    async def _run(self) -> None:
+        self.started_at = time.monotonic()
+        logger.info(f"Warming {len(self.names)} Pokémon (concurrency {self.concurrency})")
+        try:
+            # The catalog gates every lookup, so load it before the fan-out
+            await self.resource.get_catalog()
+        except Exception as e:
+            logger.warning(f"Catalog warm-up failed: {e}")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def warm(name: str) -> None:
+            async with semaphore:
+                try:
+                    await self.resource.prefetch(name)
+                    self.warmed += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.debug(f"Warm-up of {name} failed: {e}")
+            self._report()
+
+        await asyncio.gather(*(warm(name) for name in self.names))
+        self.finished_at = time.monotonic()
+        logger.info(
+            f"Warm-up finished: {self.warmed} warmed, {self.failed} failed "
+            f"in {self.finished_at - self.started_at:.1f}s"
+        )
+
+    def _report(self) -> None:
+        done = (self.warmed + self.failed) / len(self.names)
+        if done >= self._next_report:
+            logger.info(f"Warm-up {done:.0%} ({self.warmed}/{len(self.names)} warm, {self.failed} failed)")
+            while self._next_report <= done:
+                self._next_report += 0.1
+
+    def status(self) -> Dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.monotonic()) - self.started_at, 3)
+        return {
+            "ready": self.ready,
+            "targets": len(self.names),
+            "warmed": self.warmed,
+            "failed": self.failed,
+            "ready_fraction": self.ready_fraction,
+            "timeout_seconds": self.timeout,
+            "running": self._task is not None and not self._task.done(),
+            "elapsed_seconds": elapsed,
+        }
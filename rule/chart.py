@@ -2,7 +2,14 @@
 Type Effectiveness Chart
 Handles Pokémon type effectiveness calculations
 """
-from typing import Dict, List
+from itertools import combinations
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+ALL_TYPES = (
+    'normal', 'fire', 'water', 'electric', 'grass', 'ice',
+    'fighting', 'poison', 'ground', 'flying', 'psychic', 'bug',
+    'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
+)
 
 class TypeChart:
     def __init__(self):
@@ -44,28 +51,75 @@ class TypeChart:
             'fairy': {'fire': 0.5, 'fighting': 2.0, 'poison': 0.5,
                       'dragon': 2.0, 'dark': 2.0, 'steel': 0.5}
         }
+        self._compile()
+    
+    def _compile(self):
+        """Compile the chart into an 18x18 matrix and all 171 defensive profiles"""
+        self.type_index = {t: i for i, t in enumerate(ALL_TYPES)}
+        # matrix[attacker][defender]
+        self.matrix = [
+            [self.effectiveness_chart.get(atk, {}).get(dfn, 1.0) for dfn in ALL_TYPES]
+            for atk in ALL_TYPES
+        ]
+        # Defensive profile: multiplier of every attacking type against a single or dual typing
+        self.defensive_profiles: Dict[Tuple[str, ...], Tuple[float, ...]] = {}
+        for dfn in ALL_TYPES:
+            column = self.type_index[dfn]
+            self.defensive_profiles[(dfn,)] = tuple(row[column] for row in self.matrix)
+        for first, second in combinations(ALL_TYPES, 2):
+            a, b = self.defensive_profiles[(first,)], self.defensive_profiles[(second,)]
+            self.defensive_profiles[self._profile_key([first, second])] = tuple(x * y for x, y in zip(a, b))
+    
+    def _profile_key(self, defending_types: Iterable[str]) -> Tuple[str, ...]:
+        known = [t.lower() for t in defending_types if t.lower() in self.type_index]
+        return tuple(sorted(known, key=self.type_index.__getitem__))
+    
+    def get_defensive_profile(self, defending_types: Sequence[str]) -> Tuple[float, ...]:
+        """Multiplier of every attacking type (in ALL_TYPES order) against a typing
+        
+        Each listed type counts, repeats included; typings with no precomputed
+        profile (three or more types, or a repeated type) multiply single-type profiles
+        """
+        key = self._profile_key(defending_types)
+        profile = self.defensive_profiles.get(key)
+        if profile is not None:
+            return profile
+        profile = (1.0,) * len(ALL_TYPES)
+        for t in key:
+            profile = tuple(x * y for x, y in zip(profile, self.defensive_profiles[(t,)]))
+        return profile
     
     def get_effectiveness(self, attacking_type: str, defending_type: str) -> float:
         """Return effectiveness multiplier for one type vs another"""
-        return self.effectiveness_chart.get(attacking_type.lower(), {}).get(defending_type.lower(), 1.0)
+        atk = self.type_index.get(attacking_type.lower())
+        dfn = self.type_index.get(defending_type.lower())
+        if atk is None or dfn is None:
+            return 1.0
+        return self.matrix[atk][dfn]
     
     def get_all_effectiveness(self, attacking_type: str, defending_types: List[str]) -> float:
         """Effectiveness against multiple defending types"""
-        multiplier = 1.0
-        for t in defending_types:
-            multiplier *= self.get_effectiveness(attacking_type, t)
-        return multiplier
+        atk = self.type_index.get(attacking_type.lower())
+        if atk is None:
+            return 1.0
+        return self.get_defensive_profile(defending_types)[atk]
+    
+    def get_type_relations(self, attacking_type: str) -> Dict[str, List[str]]:
+        """Offensive relations of one type, in PokéAPI damage_relations terms"""
+        atk = self.type_index.get(attacking_type.lower())
+        if atk is None:
+            raise ValueError(f"Unknown type: {attacking_type}")
+        row = self.matrix[atk]
+        return {
+            "double_damage_to": [t for t, eff in zip(ALL_TYPES, row) if eff > 1.0],
+            "half_damage_to": [t for t, eff in zip(ALL_TYPES, row) if 0 < eff < 1.0],
+            "no_damage_to": [t for t, eff in zip(ALL_TYPES, row) if eff == 0],
+        }
     
     def get_weaknesses(self, pokemon_types: List[str]) -> Dict[str, float]:
         """Get weaknesses for given Pokémon types"""
-        all_types = [
-            'normal', 'fire', 'water', 'electric', 'grass', 'ice',
-            'fighting', 'poison', 'ground', 'flying', 'psychic', 'bug',
-            'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
-        ]
-        return {atk: self.get_all_effectiveness(atk, pokemon_types)
-                for atk in all_types
-                if self.get_all_effectiveness(atk, pokemon_types) != 1.0}
+        return {atk: eff for atk, eff in zip(ALL_TYPES, self.get_defensive_profile(pokemon_types))
+                if eff != 1.0}
     
     def get_resistances(self, pokemon_types: List[str]) -> Dict[str, float]:
         """Get resistances (types doing reduced damage)"""
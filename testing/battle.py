@@ -7,6 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from resource_encyclopedia.poke_data import PokemonDataResource
 from tools.battle_simulate import BattleSimulationTool
 
 async def test_basic_battle():
@@ -75,6 +76,25 @@ async def test_invalid_pokemon():
     except Exception as e:
         print(f"Expected error: {e}")
 
+async def test_shared_resource():
+    """Test that a battle reuses Pokémon already loaded through the shared resource"""
+    print("\n=== Testing Shared Data Resource ===")
+    
+    pokemon_resource = PokemonDataResource()
+    battle_tool = BattleSimulationTool(pokemon_resource)
+    
+    try:
+        await pokemon_resource.get_pokemon_data("pikachu")
+        await pokemon_resource.get_pokemon_data("charmander")
+        calls_before = pokemon_resource.cache_stats()["upstream"]["calls"]
+        
+        result = await battle_tool.simulate_battle("pikachu", "charmander")
+        print(f"Winner: {result['winner']}")
+        print(f"Upstream calls during battle: {pokemon_resource.cache_stats()['upstream']['calls'] - calls_before}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
 async def run_all_tests():
     """Run all battle tests"""
     print("Running Battle Simulation Tests...")
@@ -83,6 +103,7 @@ async def run_all_tests():
     await test_level_difference()
     await test_type_advantage()
     await test_invalid_pokemon()
+    await test_shared_resource()
     
     print("\n=== All Tests Completed ===")
 
@@ -0,0 +1,105 @@
+"""
+Cache Tests
+Test the bounded cache and its eviction policies
+"""
+import random
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resource_encyclopedia.cache import BoundedCache
+
+def test_entry_budget():
+    """Test that the entry budget holds"""
+    print("=== Testing Entry Budget ===")
+
+    cache = BoundedCache(max_entries=10)
+    for i in range(100):
+        cache.set(f"pokemon-{i}", {"id": i})
+
+    print(f"Entries: {len(cache)} (max 10)")
+    print(f"Evictions: {cache.stats()['evictions']}")
+
+def test_byte_budget():
+    """Test that the byte budget holds"""
+    print("\n=== Testing Byte Budget ===")
+
+    cache = BoundedCache(max_entries=0, max_bytes=500)
+    for i in range(100):
+        cache.set(i, {"name": "x" * 20})
+
+    print(f"Bytes: {cache.current_bytes} (max 500)")
+    print(f"Entries kept: {len(cache)}")
+
+def test_ttl_expiry():
+    """Test that entries expire after their TTL"""
+    print("\n=== Testing TTL Expiry ===")
+
+    now = [0.0]
+    cache = BoundedCache(ttl=60, clock=lambda: now[0])
+    cache.set("pikachu", {"id": 25})
+
+    print(f"Before TTL: {cache.get('pikachu')}")
+    now[0] = 61
+    print(f"After TTL: {cache.get('pikachu')}")
+    print(f"Expirations: {cache.stats()['expirations']}")
+
+def test_stale_grace_period():
+    """Test that expired entries are served as stale until the grace period ends"""
+    print("\n=== Testing Stale Grace Period ===")
+
+    now = [0.0]
+    cache = BoundedCache(ttl=60, stale_ttl=120, clock=lambda: now[0])
+    cache.set("pikachu", {"id": 25})
+
+    now[0] = 90
+    print(f"get() after TTL: {cache.get('pikachu')}")
+    print(f"get_or_stale() after TTL: {cache.get_or_stale('pikachu')}")
+    now[0] = 181
+    print(f"get_or_stale() after grace: {cache.get_or_stale('pikachu')}")
+    print(f"Stale hits: {cache.stats()['stale_hits']}, expirations: {cache.stats()['expirations']}")
+
+def test_cold_tier():
+    """Test that cold entries are compressed and promoted back on access"""
+    print("\n=== Testing Compressed Cold Tier ===")
+
+    cache = BoundedCache(max_entries=0, hot_entries=10)
+    for i in range(100):
+        cache.set(f"pokemon-{i}", {"id": i, "moves": list(range(100)), "types": ["normal"]})
+
+    print(f"Cold tier after 100 inserts: {cache.stats()['cold']}")
+    print(f"Cold read: {cache.get('pokemon-0')['id']}")
+    print(f"Promotions: {cache.stats()['cold']['promotions']}, live values: {len(cache._hot)}")
+
+def test_policy_hit_rates():
+    """Compare LRU and W-TinyLFU on skewed traffic"""
+    print("\n=== Testing Eviction Policies ===")
+
+    hot_species = [f"hot-{i}" for i in range(50)]
+    for policy in ["lru", "tinylfu"]:
+        random.seed(7)
+        cache = BoundedCache(max_entries=100, policy=policy)
+        for _ in range(20000):
+            if random.random() < 0.7:
+                key = random.choice(hot_species)
+            else:
+                key = f"cold-{random.randrange(5000)}"
+            if cache.get(key) is None:
+                cache.set(key, {"name": key})
+        print(f"{policy}: {cache.stats()}")
+
+def run_all_tests():
+    """Run all cache tests"""
+    print("Running Cache Tests...")
+
+    test_entry_budget()
+    test_byte_budget()
+    test_ttl_expiry()
+    test_stale_grace_period()
+    test_cold_tier()
+    test_policy_hit_rates()
+
+    print("\n=== All Tests Completed ===")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,109 @@
+"""
+Parse Benchmark
+Compare full json decoding with selective streaming parsing on recorded /pokemon payloads
+
+Record payloads once, then benchmark them offline:
+    python testing/parse_benchmark.py --record pikachu,mew,charizard --payloads recorded
+    python testing/parse_benchmark.py --payloads recorded
+--payloads also accepts a PokeAPI/api-data tree.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resource_encyclopedia import selective_json
+from resource_encyclopedia.dataset import FIELDS, ApiDataSource, trim_payload
+from resource_encyclopedia.http_client import UpstreamClient
+
+CHUNK_SIZE = 16 * 1024
+loop = asyncio.new_event_loop()
+
+async def record(names, directory):
+    """Save raw /pokemon payloads for later runs"""
+    os.makedirs(directory, exist_ok=True)
+    client = UpstreamClient()
+    try:
+        for name in names:
+            response = await client.get(f"https://pokeapi.co/api/v2/pokemon/{name}")
+            response.raise_for_status()
+            with open(os.path.join(directory, f"{name}.json"), "wb") as f:
+                f.write(response.content)
+            print(f"Recorded {name}: {len(response.content)} bytes")
+    finally:
+        await client.close()
+
+def load_payloads(directory, limit):
+    """Raw bodies from a flat directory of .json files or an api-data tree"""
+    try:
+        root = os.path.join(ApiDataSource(directory).root, "pokemon")
+        paths = [os.path.join(root, name, "index.json") for name in sorted(os.listdir(root)) if name.isdigit()]
+    except ValueError:
+        paths = [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(".json")]
+    bodies = []
+    for path in paths[:limit]:
+        with open(path, "rb") as f:
+            bodies.append(f.read())
+    return bodies
+
+async def chunks(body):
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start:start + CHUNK_SIZE]
+
+def full_parse(body):
+    return trim_payload("pokemon", json.loads(body))
+
+def selective_parse(body):
+    return trim_payload("pokemon", loop.run_until_complete(FIELDS["pokemon"].parse(chunks(body))))
+
+def measure(parse, bodies, repeat):
+    """Mean milliseconds per payload and the largest tracemalloc peak for one payload"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for body in bodies:
+            parse(body)
+    elapsed = (time.perf_counter() - started) / (repeat * len(bodies))
+
+    peak = 0
+    for body in bodies:
+        tracemalloc.start()
+        parse(body)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return elapsed * 1000, peak
+
+def run(bodies, repeat):
+    print(f"=== {len(bodies)} payloads, {sum(map(len, bodies)) // len(bodies)} bytes on average ===")
+    print(f"Selective parser: {'ijson ' + selective_json.ijson.backend if selective_json.ijson else 'json fallback'}")
+
+    mismatches = sum(1 for body in bodies if full_parse(body) != selective_parse(body))
+    print(f"Results identical: {mismatches == 0} ({mismatches} mismatches)")
+
+    full_ms, full_peak = measure(full_parse, bodies, repeat)
+    selective_ms, selective_peak = measure(selective_parse, bodies, repeat)
+    print(f"json.loads + trim:  {full_ms:8.3f} ms/payload, peak {full_peak / 1024:8.1f} KiB")
+    print(f"selective stream:   {selective_ms:8.3f} ms/payload, peak {selective_peak / 1024:8.1f} KiB")
+    print(f"Peak memory ratio: {selective_peak / full_peak:.2f}, time ratio: {selective_ms / full_ms:.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--payloads", required=True, help="Directory of recorded payloads")
+    parser.add_argument("--record", help="Comma-separated Pokémon to download into --payloads first")
+    parser.add_argument("--limit", type=int, default=200, help="Most payloads to benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record([name.strip() for name in args.record.split(",") if name.strip()], args.payloads))
+    bodies = load_payloads(args.payloads, args.limit)
+    if not bodies:
+        print(f"No payloads found in {args.payloads}")
+        return
+    run(bodies, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,17 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from resource_encyclopedia.dataset import LocalDataset
+from resource_encyclopedia.disk_cache import DiskCache
+from resource_encyclopedia.http_client import UpstreamClient
+from resource_encyclopedia.move_dex import MoveDex, MoveQuery
+from resource_encyclopedia.species_table import SpeciesTable, write_species_table
 from resource_encyclopedia.poke_data import PokemonDataResource
+from resource_encyclopedia.rate_limit import TokenBucket, background_priority
+from resource_encyclopedia.resilience import CircuitBreaker, ResiliencePolicy
+from resource_encyclopedia.snapshots import DatasetSnapshot
+from resource_encyclopedia.species_index import SpeciesQuery
+from resource_encyclopedia.warmup import AccessLog, CacheWarmer
 
 async def test_get_pokemon_data():
     """Test fetching individual Pokémon data"""
@@ -47,6 +57,11 @@ async def test_pokemon_list():
         print(f"Total Pokémon available: {data['count']}")
         print(f"First 10 Pokémon: {data['pokemon'][:10]}")
         
+        page = await pokemon_resource.list_all_pokemon(prefix="char", limit=2)
+        print(f"Prefix 'char' ({page['count']} matches), first page: {page['pokemon']}")
+        next_page = await pokemon_resource.list_all_pokemon(prefix="char", cursor=page["next_cursor"], limit=2)
+        print(f"Next page: {next_page['pokemon']}")
+        
     except Exception as e:
         print(f"Error: {e}")
 
@@ -64,6 +79,18 @@ async def test_type_effectiveness():
         print(f"Not very effective against: {effectiveness['half_damage_to']}")
         print(f"No effect against: {effectiveness['no_damage_to']}")
         
+        # Dual-type profiles come from the precompiled table
+        chart = pokemon_resource.type_chart
+        print(f"Defensive profiles compiled: {len(chart.defensive_profiles)}")
+        print(f"Ground vs water/flying: {chart.get_all_effectiveness('ground', ['water', 'flying'])}")
+        print(f"Charizard weaknesses: {chart.get_weaknesses(['fire', 'flying'])}")
+        
+        try:
+            await pokemon_resource.get_type_effectiveness("shadow")
+            print("Unknown type accepted (unexpected)")
+        except ValueError as e:
+            print(f"Unknown type rejected: {e}")
+        
     except Exception as e:
         print(f"Error: {e}")
 
@@ -99,4 +126,414 @@ async def test_caching():
         second_request_time = time.time() - start_time
         
         print(f"First request time: {first_request_time:.3f}s")
-        print
\ No newline at end of file
+        print(f"Second request time: {second_request_time:.3f}s")
+        print(f"Same data returned: {data1 == data2}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_shared_http_client():
+    """Test that resources reuse one pooled upstream client"""
+    print("\n=== Testing Shared HTTP Client ===")
+    
+    http_client = UpstreamClient()
+    first_resource = PokemonDataResource(http_client=http_client)
+    second_resource = PokemonDataResource(http_client=http_client)
+    
+    try:
+        await first_resource.get_pokemon_data("pikachu")
+        await second_resource.get_pokemon_data("charmander")
+        
+        print(f"Client shared: {first_resource.http_client is second_resource.http_client}")
+        print(f"Pool started: {http_client.is_started}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        await http_client.close()
+        print(f"Pool closed: {not http_client.is_started}")
+
+async def test_single_flight():
+    """Test that concurrent misses share one upstream fetch"""
+    print("\n=== Testing Single-Flight Deduplication ===")
+    
+    pokemon_resource = PokemonDataResource()
+    
+    try:
+        results = await asyncio.gather(*[pokemon_resource.get_pokemon_data("eevee") for _ in range(10)])
+        
+        print(f"All callers got the same record: {all(r is results[0] for r in results)}")
+        print(f"In-flight stats: {pokemon_resource._inflight.stats()}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_disk_cache():
+    """Test that a restarted resource is served from the disk cache"""
+    print("\n=== Testing Disk Cache ===")
+    
+    import tempfile
+    import time
+    path = os.path.join(tempfile.mkdtemp(), "pokeapi.sqlite3")
+    
+    try:
+        first_disk = DiskCache(path)
+        await PokemonDataResource(disk_cache=first_disk).get_pokemon_data("pikachu")
+        await first_disk.close()
+        
+        # A fresh resource simulates a restart with an empty L1 cache
+        second_disk = DiskCache(path)
+        start_time = time.time()
+        data = await PokemonDataResource(disk_cache=second_disk).get_pokemon_data("pikachu")
+        print(f"Warm restart lookup: {time.time() - start_time:.4f}s for {data['name'].title()}")
+        print(f"Disk stats: {second_disk.stats()}")
+        await second_disk.close()
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_offline_mode():
+    """Test serving Pokémon from a locally built dataset"""
+    print("\n=== Testing Offline Mode ===")
+    
+    dataset_dir = os.environ.get("POKEMON_DATASET_DIR", "dataset")
+    if not os.path.exists(os.path.join(dataset_dir, "manifest.json")):
+        print(f"Skipped: no dataset at {dataset_dir} (build one with python -m resource_encyclopedia.dataset)")
+        return
+    
+    try:
+        pokemon_resource = PokemonDataResource(dataset=LocalDataset.load(dataset_dir))
+        data = await pokemon_resource.get_pokemon_data("pikachu")
+        
+        print(f"Offline: {pokemon_resource.offline}")
+        print(f"Name: {data['name'].title()}, Types: {', '.join(data['types'])}")
+        print(f"Moves resolved locally: {len(data['moves'])}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_dataset_swap():
+    """Test swapping in a new dataset version without dropping unchanged cache entries"""
+    print("\n=== Testing Dataset Snapshot Swap ===")
+    
+    dataset_dir = os.environ.get("POKEMON_DATASET_DIR", "dataset")
+    if not os.path.exists(os.path.join(dataset_dir, "manifest.json")):
+        print(f"Skipped: no dataset at {dataset_dir} (build one with python -m resource_encyclopedia.dataset)")
+        return
+    
+    try:
+        pokemon_resource = PokemonDataResource(dataset=LocalDataset.load(dataset_dir))
+        await pokemon_resource.get_pokemon_data("pikachu")
+        bulbasaur = await pokemon_resource.get_pokemon_record("bulbasaur")
+        
+        # A second copy with one edited entry stands in for a rebuilt dataset version
+        snapshot = DatasetSnapshot.load(dataset_dir)
+        snapshot.dataset.manifest = {**snapshot.dataset.manifest, "version": "swap-test"}
+        snapshot.dataset.tables["pokemon"].get("pikachu")["stats"][0]["base_stat"] += 1
+        
+        print(f"Swap: {await pokemon_resource.swap_snapshot(snapshot)}")
+        pikachu = await pokemon_resource.get_pokemon_data("pikachu")
+        print(f"Pikachu HP after swap: {pikachu['base_stats']['hp']}")
+        print(f"Unchanged Bulbasaur record kept: {await pokemon_resource.get_pokemon_record('bulbasaur') is bulbasaur}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_species_table():
+    """Test writing and memory-mapping a columnar species table"""
+    print("\n=== Testing Species Table ===")
+    
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "species.bin")
+    
+    try:
+        pokemon_resource = PokemonDataResource()
+        records = [await pokemon_resource.get_pokemon_data(name) for name in ["pikachu", "charmander"]]
+        write_species_table(path, records)
+        
+        table = SpeciesTable(path)
+        print(f"Rows: {len(table)}")
+        print(f"Pikachu from table: {table.get('pikachu')}")
+        print(f"Lookup by id 4: {table.get('4')['name']}")
+        table.close()
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_species_query():
+    """Test multi-criteria queries over the species table indexes"""
+    print("\n=== Testing Species Query ===")
+    
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "species.bin")
+    
+    try:
+        fetcher = PokemonDataResource()
+        names = ["charmander", "charizard", "dragonite", "pikachu", "jolteon", "rapidash", "gyarados"]
+        records = [await fetcher.get_pokemon_data(name, profile="battle") for name in names]
+        write_species_table(path, records)
+        
+        pokemon_resource = PokemonDataResource(species_table=SpeciesTable(path))
+        query = SpeciesQuery.from_params({"types": "fire,dragon", "min_speed": 80, "sort": "-special_attack"})
+        result = await pokemon_resource.query_pokemon(query)
+        print(f"Fire or dragon with speed >= 80: {result['count']}")
+        for record in result["pokemon"]:
+            print(f"  {record['name']}: Sp. Atk {record['base_stats']['special_attack']}")
+        
+        page = await pokemon_resource.query_pokemon(SpeciesQuery.from_params({"limit": 3}))
+        print(f"First page of 3: {[r['name'] for r in page['pokemon']]}, next cursor: {page['next_cursor']}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_move_dex():
+    """Test resolving and querying moves from the bulk-loaded move dex"""
+    print("\n=== Testing Move Dex ===")
+    
+    dataset_dir = os.environ.get("POKEMON_DATASET_DIR", "dataset")
+    if not os.path.exists(os.path.join(dataset_dir, "move.json.gz")):
+        print(f"Skipped: no move table at {dataset_dir} (build one with python -m resource_encyclopedia.dataset)")
+        return
+    
+    try:
+        move_dex = MoveDex.load(dataset_dir)
+        pokemon_resource = PokemonDataResource(move_dex=move_dex)
+        data = await pokemon_resource.get_pokemon_data("pikachu")
+        upstream = pokemon_resource.http_client.stats()
+        print(f"Moves in the dex: {len(move_dex)}")
+        print(f"Pikachu's {len(data['moves'])} moves resolved with {upstream['calls']} upstream calls")
+        
+        query = MoveQuery.from_params({"types": "fire", "categories": "special", "min_power": 90, "sort": "-power"})
+        result = await pokemon_resource.query_moves(query)
+        print(f"Special fire moves with power >= 90: {result['count']}")
+        for move in result["moves"][:5]:
+            print(f"  {move['name']}: power {move['power']}, accuracy {move['accuracy']}")
+        
+        burns = await pokemon_resource.query_moves(MoveQuery.from_params({"ailments": "burn", "limit": 3}))
+        print(f"Moves that can burn: {burns['count']}, first: {[m['name'] for m in burns['moves']]}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_evolution_family_sharing():
+    """Test that one evolution family shares a single chain fetch"""
+    print("\n=== Testing Shared Evolution Chains ===")
+    
+    pokemon_resource = PokemonDataResource()
+    
+    try:
+        for name in ["bulbasaur", "ivysaur", "venusaur"]:
+            data = await pokemon_resource.get_pokemon_data(name)
+            print(f"{name.title()}: {[stage['name'] for stage in data['evolution_chain']]}")
+        
+        stats = pokemon_resource.cache_stats()["evolution_chains"]
+        print(f"Chains cached: {stats['entries']}, hits: {stats['hits']}, misses: {stats['misses']}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_negative_cache():
+    """Test that invalid names are rejected without upstream requests"""
+    print("\n=== Testing Negative Cache ===")
+    
+    pokemon_resource = PokemonDataResource()
+    
+    for attempt in range(3):
+        try:
+            await pokemon_resource.get_pokemon_data("invalidmon")
+            print("This should not print")
+        except ValueError as e:
+            print(f"Attempt {attempt + 1}: {e}")
+    
+    print(f"Rejected locally: {pokemon_resource.rejected_names}")
+    print(f"Negative cache: {pokemon_resource.cache_stats()['negative']}")
+
+async def test_warmup():
+    """Test warm-up of the most requested Pokémon from a persisted access log"""
+    print("\n=== Testing Cache Warm-up ===")
+    
+    import tempfile
+    log_path = os.path.join(tempfile.mkdtemp(), "access_counts.json")
+    access_log = AccessLog(log_path)
+    pokemon_resource = PokemonDataResource(access_log=access_log)
+    
+    try:
+        for name in ["pikachu", "pikachu", "charmander"]:
+            await pokemon_resource.get_pokemon_data(name)
+        access_log.save()
+        
+        # Next "deploy": fresh caches, same access log
+        restarted_log = AccessLog(log_path)
+        restarted_log.load()
+        restarted = PokemonDataResource(access_log=restarted_log)
+        warmer = CacheWarmer(restarted, ["bulbasaur"] + restarted_log.top(2), concurrency=2, ready_fraction=1.0)
+        print(f"Warm-up targets: {warmer.names}, ready before: {warmer.ready}")
+        await warmer.run()
+        print(f"Status: {warmer.status()}")
+        print(f"Cached after warm-up: {len(restarted.cache)}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_circuit_breaker():
+    """Test that an open circuit fails fast and stored data is still served"""
+    print("\n=== Testing Circuit Breaker ===")
+    
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=lambda: now[0])
+    for _ in range(2):
+        breaker.record_failure()
+    print(f"After 2 failures: {breaker.state}, request allowed: {breaker.allow()}")
+    now[0] = 31
+    print(f"After reset timeout: probe allowed: {breaker.allow()}, second request allowed: {breaker.allow()}")
+    breaker.record_success()
+    print(f"After successful probe: {breaker.state}")
+    
+    # Nothing listens on port 9, which stands in for a PokéAPI outage
+    policy = ResiliencePolicy(max_attempts=2, base_delay=0.01, breaker=CircuitBreaker(failure_threshold=1))
+    client = UpstreamClient(resilience=policy)
+    pokemon_resource = PokemonDataResource(http_client=client)
+    pokemon_resource.base_url = "http://127.0.0.1:9/api/v2"
+    for attempt in range(2):
+        try:
+            await pokemon_resource.get_pokemon_data("pikachu")
+        except ValueError as e:
+            print(f"Attempt {attempt + 1}: {e}")
+    print(f"Upstream counters: {pokemon_resource.cache_stats()['upstream']}")
+    await client.close()
+
+async def test_rate_limiter():
+    """Test that interactive requests take tokens ahead of background traffic"""
+    print("\n=== Testing Rate Limiter ===")
+    
+    import time
+    bucket = TokenBucket(rate=20, burst=1)
+    order = []
+    
+    async def background(i):
+        with background_priority():
+            await bucket.acquire()
+        order.append(f"background-{i}")
+    
+    async def interactive(i):
+        await asyncio.sleep(0.01)
+        await bucket.acquire()
+        order.append(f"interactive-{i}")
+    
+    start = time.time()
+    await asyncio.gather(*(background(i) for i in range(3)), *(interactive(i) for i in range(3)))
+    print(f"Grant order: {order}")
+    print(f"6 requests at 20/s took {time.time() - start:.2f}s")
+    print(f"Stats: {bucket.stats()}")
+
+async def test_load_profiles():
+    """Test that a battle-profile record is upgraded to full without refetching"""
+    print("\n=== Testing Load Profiles ===")
+    
+    pokemon_resource = PokemonDataResource()
+    
+    try:
+        battle = await pokemon_resource.get_pokemon_data("pikachu", profile="battle")
+        print(f"Battle profile: {len(battle['moves'])} moves, generation {battle['generation']}")
+        print(f"Cache after battle profile: {pokemon_resource.cache_stats()['payloads']['entries']} payloads, "
+              f"{pokemon_resource.cache_stats()['species']['entries']} species")
+        
+        full = await pokemon_resource.get_pokemon_data("pikachu")
+        print(f"Upgraded to {full['profile']}: {len(full['moves'])} moves, generation {full['generation']}")
+        print(f"Payload cache hits during upgrade: {pokemon_resource.cache_stats()['payloads']['hits']}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_move_pages():
+    """Test paging through a full movepool with lazily resolved details"""
+    print("\n=== Testing Movepool Pages ===")
+    
+    pokemon_resource = PokemonDataResource()
+    
+    try:
+        page = await pokemon_resource.get_move_page("pikachu", limit=10)
+        print(f"Pikachu learns {page['count']} moves; first page: {[move['name'] for move in page['moves']]}")
+        print(f"Move details cached after one page: {pokemon_resource.cache_stats()['moves']['entries']}")
+        
+        seen = len(page["moves"])
+        while page["next_cursor"]:
+            page = await pokemon_resource.get_move_page("pikachu", cursor=page["next_cursor"], limit=50)
+            seen += len(page["moves"])
+        print(f"Paged through {seen} moves")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_move_table():
+    """Test that records share interned moves instead of copying details"""
+    print("\n=== Testing Move Table ===")
+    
+    pokemon_resource = PokemonDataResource()
+    
+    try:
+        pikachu = await pokemon_resource.get_pokemon_record("pikachu")
+        raichu = await pokemon_resource.get_pokemon_record("raichu")
+        shared = set(pikachu["moves"]) & set(raichu["moves"])
+        print(f"Pikachu and Raichu share {len(shared)} resolved moves, stored once")
+        print(f"Move table: {pokemon_resource.cache_stats()['move_table']}")
+        
+        data = pokemon_resource.serialize(pikachu)
+        print(f"Serialized first move: {data['moves'][0]['name']} ({data['moves'][0]['details']['type']})")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+
+async def test_shared_disk_cache():
+    """Test that workers sharing one disk cache fetch each entry once per host"""
+    print("\n=== Testing Shared Disk Cache ===")
+    
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "pokeapi.sqlite3")
+    # Each DiskCache has its own connection and lease owner, like a separate worker
+    disks = [DiskCache(path) for _ in range(4)]
+    
+    try:
+        await asyncio.gather(*[PokemonDataResource(disk_cache=disk).get_pokemon_data("pikachu") for disk in disks])
+        fetched = sum(disk.leases_acquired for disk in disks)
+        filled = sum(disk.peer_fills for disk in disks)
+        print(f"Journal mode: {disks[0].journal_mode}")
+        print(f"Entries fetched upstream: {fetched}, picked up from another worker: {filled}")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        for disk in disks:
+            await disk.close()
+
+async def run_all_tests():
+    """Run all resource tests"""
+    print("Running Pokémon Data Resource Tests...")
+    
+    await test_get_pokemon_data()
+    await test_pokemon_list()
+    await test_type_effectiveness()
+    await test_invalid_pokemon()
+    await test_caching()
+    await test_shared_http_client()
+    await test_single_flight()
+    await test_disk_cache()
+    await test_offline_mode()
+    await test_dataset_swap()
+    await test_species_table()
+    await test_species_query()
+    await test_move_dex()
+    await test_evolution_family_sharing()
+    await test_negative_cache()
+    await test_warmup()
+    await test_circuit_breaker()
+    await test_rate_limiter()
+    await test_load_profiles()
+    await test_move_pages()
+    await test_move_table()
+    await test_shared_disk_cache()
+    
+    print("\n=== All Tests Completed ===")
+
+if __name__ == "__main__":
+    asyncio.run(run_all_tests())
@@ -3,8 +3,9 @@ Battle Simulation Tool
 MCP tool for simulating Pokémon battles
 """
 import random
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional
 import logging
+from resource_encyclopedia.move_table import Move
 from resource_encyclopedia.poke_data import PokemonDataResource
 from rule.chart import TypeChart
 from rule.damage_calcu import DamageCalculator
@@ -12,11 +13,16 @@ from rule.stat_effect import StatusEffectManager
 
 logger = logging.getLogger(__name__)
 
+# Used when a Pokémon has no resolved moves
+TACKLE = Move(33, "tackle")
+TACKLE.update({"type": "normal", "category": "physical", "power": 40, "accuracy": 100, "pp": 35})
+
 class BattleSimulationTool:
     """Pokémon battle simulation engine"""
 
-    def __init__(self):
-        self.pokemon_data = PokemonDataResource()
+    def __init__(self, pokemon_data: Optional[PokemonDataResource] = None):
+        # The server injects its shared resource; standalone use gets a private one
+        self.pokemon_data = pokemon_data if pokemon_data is not None else PokemonDataResource()
         self.type_chart = TypeChart()
         self.damage_calculator = DamageCalculator()
         self.status_manager = StatusEffectManager()
@@ -25,8 +31,9 @@ class BattleSimulationTool:
                               level1: int = 50, level2: int = 50) -> Dict[str, Any]:
         """Run a complete battle simulation between two Pokémon"""
         try:
-            pokemon1_data = await self.pokemon_data.get_pokemon_data(pokemon1_name)
-            pokemon2_data = await self.pokemon_data.get_pokemon_data(pokemon2_name)
+            # Battles only need stats, types and four moves
+            pokemon1_data = await self.pokemon_data.get_pokemon_record(pokemon1_name, profile="battle")
+            pokemon2_data = await self.pokemon_data.get_pokemon_record(pokemon2_name, profile="battle")
             pokemon1 = self._create_battle_pokemon(pokemon1_data, level1)
             pokemon2 = self._create_battle_pokemon(pokemon2_data, level2)
             
@@ -132,7 +139,7 @@ class BattleSimulationTool:
     
     def _create_battle_pokemon(self, pokemon_data: Dict[str, Any], level: int) -> Dict[str, Any]:
         """Prepare a Pokémon with calculated stats for battle"""
-        base_stats = pokemon_data['base_stats']
+        base_stats, types = self._base_stats_and_types(pokemon_data)
         hp = int(((2 * base_stats['hp'] * level) / 100) + level + 10)
         attack = int(((2 * base_stats['attack'] * level) / 100) + 5)
         defense = int(((2 * base_stats['defense'] * level) / 100) + 5)
@@ -142,7 +149,7 @@ class BattleSimulationTool:
         return {
             'name': pokemon_data['name'],
             'level': level,
-            'types': pokemon_data['types'],
+            'types': types,
             'max_hp': hp,
             'current_hp': hp,
             'attack': attack,
@@ -150,11 +157,24 @@ class BattleSimulationTool:
             'special_attack': sp_attack,
             'special_defense': sp_defense,
             'speed': speed,
-            'moves': pokemon_data['moves'][:4],
+            'moves': self.pokemon_data.move_table.resolve(pokemon_data['moves'][:4]),
             'status': None,
             'status_turns': 0
         }
     
+    def _base_stats_and_types(self, pokemon_data: Dict[str, Any]) -> Tuple[Dict[str, int], list]:
+        """Base stats and types from the record. The mapped species table is read
+        offline, where it belongs to the same dataset, or when the record lacks them;
+        online a species.bin left on disk may be older than PokéAPI.
+        """
+        base_stats, types = pokemon_data.get('base_stats'), pokemon_data.get('types')
+        table = self.pokemon_data.species_table
+        if table is not None and (self.pokemon_data.dataset is not None or not base_stats or not types):
+            row = table.find(pokemon_data['name'])
+            if row is not None:
+                return table.base_stats(row), table.types(row)
+        return base_stats, types
+    
     def _determine_turn_order(self, pokemon1: Dict, pokemon2: Dict) -> Tuple[Dict, Dict]:
         """Decide move order based on speed"""
         if pokemon1['speed'] > pokemon2['speed']:
@@ -167,19 +187,10 @@ class BattleSimulationTool:
         """Perform a move and return damage dealt"""
         if not self.status_manager.can_move(attacker):
             return 0, "struggled", 1.0
-        move = random.choice(attacker['moves']) if attacker['moves'] else {
-            "name": "tackle", "details": {"type": "normal", "category": "physical", "power": 40}
-        }
-        move_name = move['name']
-        details = move.get('details', {})
-        move_type = details.get('type', 'normal')
-        move_category = details.get('category', 'physical')
-        move_power = details.get('power', 40) or 40
-        effectiveness = 1.0
-        for defender_type in defender['types']:
-            effectiveness *= self.type_chart.get_effectiveness(move_type, defender_type)
+        move = random.choice(attacker['moves']) if attacker['moves'] else TACKLE
+        effectiveness = self.type_chart.get_all_effectiveness(move.type, defender['types'])
         damage = self.damage_calculator.calculate_damage(
-            attacker, defender, move_power, move_type, move_category, effectiveness
+            attacker, defender, move.power or 40, move.type, move.category, effectiveness
         )
         defender['current_hp'] = max(0, defender['current_hp'] - damage)
-        return damage, move_name, effectiveness
+        return damage, move.name, effectiveness